@@ -1,15 +1,35 @@
 """AI-powered electrical symbol detection and counting using Gemini Vision."""
 
 import json
-import base64
+import hashlib
 import io
+import math
+import os
+import random
+import threading
+import time
+import weakref
+from collections import Counter, OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
-from typing import Optional
+from typing import NamedTuple, Optional
 
-from PIL import Image
+from PIL import Image, ImageDraw, ImageFont
 
+from sparkestimate.core.gemini_client import shared_client
 
-@dataclass
+try:
+    from google.genai import types as genai_types
+except ImportError:  # only needed once a Gemini request is made
+    genai_types = None
+
+try:  # optional: orjson parses Gemini replies several times faster
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
+
+@dataclass(slots=True)
 class DetectedSymbol:
     """A single detected electrical symbol."""
     symbol_type: str
@@ -19,176 +39,460 @@ class DetectedSymbol:
     notes: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
+class SymbolTable:
+    """Detected symbols for one page, stored column-wise (struct of arrays).
+
+    Aggregation and confidence filtering only read one or two columns, so
+    they scan flat lists instead of a DetectedSymbol object per row.
+    """
+    types: list[str] = field(default_factory=list)
+    counts: list[int] = field(default_factory=list)
+    confidences: list[float] = field(default_factory=list)
+    locations: list[list[list[float]]] = field(default_factory=list)
+    notes: list[str] = field(default_factory=list)
+
+    @classmethod
+    def from_symbols(cls, symbols: list[DetectedSymbol]) -> "SymbolTable":
+        table = cls()
+        for sym in symbols:
+            table.add(sym.symbol_type, sym.count, sym.confidence,
+                      sym.locations, sym.notes)
+        return table
+
+    def add(
+        self,
+        symbol_type: str,
+        count: int,
+        confidence: float,
+        locations: list[list[float]],
+        notes: str = "",
+    ) -> None:
+        self.types.append(symbol_type)
+        self.counts.append(count)
+        self.confidences.append(confidence)
+        self.locations.append(locations)
+        self.notes.append(notes)
+
+    def __len__(self) -> int:
+        return len(self.types)
+
+    def row(self, i: int) -> DetectedSymbol:
+        """Materialize row i as a DetectedSymbol."""
+        return DetectedSymbol(
+            symbol_type=self.types[i],
+            count=self.counts[i],
+            confidence=self.confidences[i],
+            locations=self.locations[i],
+            notes=self.notes[i],
+        )
+
+
+@dataclass(slots=True, init=False)
 class PageAnalysis:
-    """Analysis results for a single drawing page."""
+    """Analysis results for a single drawing page.
+
+    Symbols are stored column-wise in ``table``. ``symbols`` is still
+    accepted by the constructor (positionally or by keyword) and converted.
+    """
     page_number: int
-    symbols: list[DetectedSymbol]
-    page_type: str = ""  # "electrical", "architectural", "mechanical", etc.
-    is_electrical: bool = False
-    raw_response: str = ""
-    annotated_image: Optional[Image.Image] = None
-
-
-ANALYSIS_PROMPT = """You are an expert electrical estimator analyzing a residential electrical floor plan drawing.
-This drawing follows Canadian Electrical Code (CEC) / NEC symbol conventions.
-
-TASK: Identify and count EVERY electrical symbol on this drawing page.
-
-For each symbol type found, provide:
-1. The symbol type (use the standardized names below)
-2. The exact count
-3. A confidence score (0.0 to 1.0) for your count accuracy
-4. Approximate x,y locations as percentages of the image (0-100)
-
-STANDARDIZED SYMBOL NAMES (use these exactly):
-- duplex_receptacle (standard 15A/20A outlet)
-- gfci_receptacle (ground fault circuit interrupter outlet)
-- weather_resistant_receptacle
-- split_receptacle
-- dedicated_receptacle (for specific appliances)
-- single_pole_switch
-- three_way_switch
-- four_way_switch
-- dimmer_switch
-- recessed_light
-- surface_mount_light
-- pendant_light
-- track_light
-- wall_sconce
-- exterior_light
-- pot_light (same as recessed)
-- fluorescent_light
-- led_panel_light
-- ceiling_fan
-- exhaust_fan
-- range_hood_fan
-- smoke_detector
-- co_detector
-- smoke_co_combo
-- data_outlet
-- tv_outlet
-- phone_outlet
-- doorbell
-- thermostat
-- panel_board
-- subpanel
-- junction_box
-- ev_charger_outlet
-- dryer_outlet
-- range_outlet
-- ac_disconnect
-- outdoor_receptacle
-- motion_sensor
-- occupancy_sensor
-
-Also determine:
-- Is this page an electrical plan? (true/false)
-- What type of page is this? (electrical, architectural, mechanical, plumbing, cover, schedule, detail, other)
-
-RESPOND WITH VALID JSON ONLY (no markdown, no explanation):
-{
-  "is_electrical": true,
-  "page_type": "electrical",
-  "symbols": [
-    {"symbol_type": "duplex_receptacle", "count": 14, "confidence": 0.95, "locations": [[25.5, 30.2], [45.1, 30.5]], "notes": ""},
-    {"symbol_type": "single_pole_switch", "count": 8, "confidence": 0.90, "locations": [[10.0, 20.0]], "notes": ""}
-  ],
-  "observations": "Any relevant notes about the drawing"
+    page_type: str  # "electrical", "architectural", "mechanical", etc.
+    is_electrical: bool
+    raw_response: str
+    annotated_image: Optional[Image.Image]
+    table: SymbolTable
+
+    def __init__(
+        self,
+        page_number: int,
+        symbols: Optional[list[DetectedSymbol]] = None,
+        page_type: str = "",
+        is_electrical: bool = False,
+        raw_response: str = "",
+        annotated_image: Optional[Image.Image] = None,
+        *,
+        table: Optional[SymbolTable] = None,
+    ):
+        if symbols is not None:
+            if table is not None:
+                raise TypeError("PageAnalysis takes symbols or table, not both")
+            table = SymbolTable.from_symbols(symbols)
+        self.page_number = page_number
+        self.page_type = page_type
+        self.is_electrical = is_electrical
+        self.raw_response = raw_response
+        self.annotated_image = annotated_image
+        self.table = table if table is not None else SymbolTable()
+
+    @property
+    def symbols(self) -> tuple[DetectedSymbol, ...]:
+        """Read-only row view of ``table``, built on demand."""
+        table = self.table
+        return tuple(table.row(i) for i in range(len(table)))
+
+
+# Standardized symbol names — also the enum in PAGE_ANALYSIS_SCHEMA
+SYMBOL_TYPES = (
+    "duplex_receptacle", "gfci_receptacle", "weather_resistant_receptacle",
+    "split_receptacle", "dedicated_receptacle", "single_pole_switch",
+    "three_way_switch", "four_way_switch", "dimmer_switch", "recessed_light",
+    "surface_mount_light", "pendant_light", "track_light", "wall_sconce",
+    "exterior_light", "pot_light", "fluorescent_light", "led_panel_light",
+    "ceiling_fan", "exhaust_fan", "range_hood_fan", "smoke_detector",
+    "co_detector", "smoke_co_combo", "data_outlet", "tv_outlet", "phone_outlet",
+    "doorbell", "thermostat", "panel_board", "subpanel", "junction_box",
+    "ev_charger_outlet", "dryer_outlet", "range_outlet", "ac_disconnect",
+    "outdoor_receptacle", "motion_sensor", "occupancy_sensor",
+)
+
+PAGE_TYPES = (
+    "electrical", "architectural", "mechanical", "plumbing", "cover",
+    "schedule", "detail", "other",
+)
+
+# Structured-output schema: Gemini returns exactly this JSON shape, so the
+# prompt needs no field descriptions or JSON example.
+PAGE_ANALYSIS_SCHEMA = {
+    "type": "OBJECT",
+    "properties": {
+        "is_electrical": {"type": "BOOLEAN"},
+        "page_type": {"type": "STRING", "enum": list(PAGE_TYPES)},
+        "symbols": {
+            "type": "ARRAY",
+            "items": {
+                "type": "OBJECT",
+                "properties": {
+                    "symbol_type": {"type": "STRING", "enum": list(SYMBOL_TYPES)},
+                    "count": {"type": "INTEGER"},
+                    "confidence": {"type": "NUMBER"},
+                    "locations": {
+                        "type": "ARRAY",
+                        "items": {"type": "ARRAY", "items": {"type": "NUMBER"}},
+                    },
+                    "notes": {"type": "STRING"},
+                },
+                "required": ["symbol_type", "count", "confidence"],
+            },
+        },
+        "observations": {"type": "STRING"},
+    },
+    "required": ["is_electrical", "page_type", "symbols"],
 }
 
-If this is NOT an electrical page, return:
-{"is_electrical": false, "page_type": "architectural", "symbols": [], "observations": "This appears to be an architectural floor plan"}
+ANALYSIS_PROMPT = f"""You are an expert electrical estimator analyzing a residential electrical floor plan drawing (CEC / NEC symbol conventions).
+
+Identify and count EVERY electrical symbol on this page. Per symbol type give the exact count, a confidence (0.0-1.0) in that count, and approximate x,y locations as image percentages (0-100).
+Symbol types: {", ".join(SYMBOL_TYPES)}. pot_light = recessed; dedicated_receptacle = appliance outlet.
+Set is_electrical and page_type; non-electrical pages get an empty symbols list.
 
 COUNT CAREFULLY. Double-check your counts. Mark confidence lower if symbols are unclear or overlapping.
 """
 
 
+# Appended to ANALYSIS_PROMPT when several pages are tiled into one image
+TILED_PROMPT_SUFFIX = """
+This image is a grid of {n} separate drawing pages ("tiles"), each labelled with
+its tile number (#0, #1, ...) in the top-left corner. Analyze every tile
+independently, do not count symbols across tile borders, and return one
+entry per tile with its tile_index.
+"""
+
+TILED_ANALYSIS_SCHEMA = {
+    "type": "OBJECT",
+    "properties": {
+        "tiles": {
+            "type": "ARRAY",
+            "items": {
+                **PAGE_ANALYSIS_SCHEMA,
+                "properties": {
+                    "tile_index": {"type": "INTEGER"},
+                    **PAGE_ANALYSIS_SCHEMA["properties"],
+                },
+                "required": ["tile_index", *PAGE_ANALYSIS_SCHEMA["required"]],
+            },
+        },
+    },
+    "required": ["tiles"],
+}
+
+# Part of the response cache key — a prompt or schema edit invalidates cached pages
+PROMPT_HASH = hashlib.sha256(
+    (ANALYSIS_PROMPT + json.dumps(PAGE_ANALYSIS_SCHEMA, sort_keys=True)).encode("utf-8")
+).hexdigest()
+TILED_PROMPT_HASH = hashlib.sha256(
+    (ANALYSIS_PROMPT + TILED_PROMPT_SUFFIX
+     + json.dumps(TILED_ANALYSIS_SCHEMA, sort_keys=True)).encode("utf-8")
+).hexdigest()
+
+
+class _EncodedImage(NamedTuple):
+    """An upload-ready page image plus its content hash."""
+    data: bytes
+    mime_type: str
+    digest: str  # sha256 hex of data
+
+
+# Upload encodings accepted by ElectricalAnalyzer(image_format=...)
+IMAGE_FORMATS = ("jpeg", "webp", "png")
+
+# HTTP status codes worth retrying (rate limit + transient server errors)
+RETRYABLE_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
+
 class ElectricalAnalyzer:
     """Analyzes electrical drawings using Gemini Vision API."""
 
-    def __init__(self, api_key: str, model: str = "gemini-2.0-flash"):
+    def __init__(
+        self,
+        api_key: str,
+        model: str = "gemini-2.0-flash",
+        concurrency: int = 4,
+        max_retries: int = 3,
+        cache_size: int = 128,
+        use_prompt_cache: bool = False,
+        prompt_cache_ttl_s: int = 3600,
+        max_edge: int = 1536,
+        jpeg_quality: int = 85,
+        max_rpm: Optional[int] = None,
+        image_format: str = "jpeg",
+    ):
+        if image_format not in IMAGE_FORMATS:
+            raise ValueError(
+                f"image_format must be one of {IMAGE_FORMATS}, got {image_format!r}"
+            )
         self.api_key = api_key
+        self.image_format = image_format
         self.model = model
+        self.max_edge = max_edge
+        self.jpeg_quality = jpeg_quality
+        self.concurrency = max(1, concurrency)
+        # Space out parallel submissions to stay under the API's requests/min
+        self._stagger_s = 60.0 / max_rpm if max_rpm else 0.0
+        self.max_retries = max(0, max_retries)
+        self.cache_size = max(0, cache_size)
         self._client = None
+        # LRU of cache key -> raw JSON response text
+        self._response_cache: OrderedDict[str, str] = OrderedDict()
+        # id(Image) -> {(format, max_edge, quality): encoded upload};
+        # evicted on image GC
+        self._encoded: dict[int, dict[tuple, _EncodedImage]] = {}
+        self._cache_lock = threading.Lock()
+        # Gemini explicit context cache holding ANALYSIS_PROMPT
+        self.use_prompt_cache = use_prompt_cache
+        self.prompt_cache_ttl_s = prompt_cache_ttl_s
+        self._prompt_cache_name: Optional[str] = None
+        self._prompt_cache_expiry = 0.0
+        self._prompt_cache_failed = False
+        self._prompt_cache_lock = threading.Lock()
 
     def _get_client(self):
         if self._client is None:
-            from google import genai
-            self._client = genai.Client(api_key=self.api_key)
+            self._client = shared_client(self.api_key, self.concurrency)
         return self._client
 
-    def _image_to_base64(self, img: Image.Image) -> str:
+    def _get_prompt_cache(self, client) -> Optional[str]:
+        """Return the cached-content name for ANALYSIS_PROMPT, creating or
+        renewing it as needed. None means send the prompt inline."""
+        if not self.use_prompt_cache or self._prompt_cache_failed:
+            return None
+        with self._prompt_cache_lock:
+            if self._prompt_cache_name and time.monotonic() < self._prompt_cache_expiry:
+                return self._prompt_cache_name
+
+            prompt = genai_types.Content(
+                role="user",
+                parts=[genai_types.Part.from_text(text=ANALYSIS_PROMPT)],
+            )
+            try:
+                cache = client.caches.create(
+                    model=self.model,
+                    config=genai_types.CreateCachedContentConfig(
+                        contents=[prompt],
+                        ttl=f"{self.prompt_cache_ttl_s}s",
+                    ),
+                )
+            except Exception:
+                # e.g. prompt below the model's minimum cacheable token count
+                self._prompt_cache_failed = True
+                return None
+            self._prompt_cache_name = cache.name
+            # Renew a minute early so requests never reference an expired cache
+            self._prompt_cache_expiry = (
+                time.monotonic() + max(self.prompt_cache_ttl_s - 60, 0)
+            )
+            return self._prompt_cache_name
+
+    def _generate_with_retry(self, client, **kwargs):
+        """Call generate_content, backing off on 429 / transient 5xx errors."""
+        for attempt in range(self.max_retries + 1):
+            try:
+                return client.models.generate_content(**kwargs)
+            except Exception as exc:
+                code = getattr(exc, "code", None)
+                if code not in RETRYABLE_STATUS_CODES or attempt >= self.max_retries:
+                    raise
+                # Exponential backoff with jitter: ~1s, 2s, 4s, ...
+                time.sleep(2 ** attempt + random.uniform(0, 0.5))
+
+    def _cache_key(self, digest: str, prompt_hash: str = PROMPT_HASH) -> str:
+        return f"{digest}:{prompt_hash}:{self.model}"
+
+    def _cache_get(self, key: str) -> Optional[str]:
+        with self._cache_lock:
+            raw_text = self._response_cache.get(key)
+            if raw_text is not None:
+                self._response_cache.move_to_end(key)
+            return raw_text
+
+    def _cache_put(self, key: str, raw_text: str) -> None:
+        if not self.cache_size:
+            return
+        with self._cache_lock:
+            self._response_cache[key] = raw_text
+            self._response_cache.move_to_end(key)
+            while len(self._response_cache) > self.cache_size:
+                self._response_cache.popitem(last=False)
+
+    def _encode_image(self, img: Image.Image) -> _EncodedImage:
+        """Downscale to max_edge and encode for upload.
+
+        Gemini bills visual tokens by pixel count, so a 300 DPI page is
+        shrunk before sending. Encoding follows ``image_format``: lossy JPEG
+        (PNG fallback for images with alpha), lossless WebP (fastest method;
+        smaller than PNG on line drawings), or PNG.
+        The result (bytes, mime type and sha256) is memoized per Image object
+        and encoding settings (dropped when the image is garbage collected),
+        so re-analyzing the same page neither re-encodes nor re-hashes it.
+        Images must not be mutated in place after being analyzed.
+        """
+        key = id(img)
+        by_settings = self._encoded.get(key)
+        if by_settings is None:
+            by_settings = self._encoded[key] = {}
+            weakref.finalize(img, self._encoded.pop, key, None)
+        settings = (self.image_format, self.max_edge, self.jpeg_quality)
+        encoded = by_settings.get(settings)
+        if encoded is None:
+            encoded = by_settings[settings] = self._encode_uncached(img)
+        return encoded
+
+    def _encode_uncached(self, img: Image.Image) -> _EncodedImage:
+        longest = max(img.size)
+        if self.max_edge and longest > self.max_edge:
+            scale = self.max_edge / longest
+            img = img.resize(
+                (max(1, int(img.width * scale)), max(1, int(img.height * scale))),
+                Image.LANCZOS,
+            )
+
         buf = io.BytesIO()
-        img.save(buf, format="PNG")
-        return base64.b64encode(buf.getvalue()).decode("utf-8")
+        has_alpha = img.mode in ("RGBA", "LA") or "transparency" in img.info
+        if self.image_format == "webp":
+            img.save(buf, format="WEBP", lossless=True, method=0)
+            mime_type = "image/webp"
+        elif self.image_format == "png" or has_alpha:
+            img.save(buf, format="PNG")
+            mime_type = "image/png"
+        else:
+            if img.mode not in ("RGB", "L"):
+                img = img.convert("RGB")
+            img.save(buf, format="JPEG", quality=self.jpeg_quality, optimize=True)
+            mime_type = "image/jpeg"
+        data = buf.getvalue()
+        return _EncodedImage(data, mime_type, hashlib.sha256(data).hexdigest())
+
+    def _generate(
+        self,
+        image_bytes: bytes,
+        mime_type: str,
+        extra_prompt: str = "",
+        schema: dict = PAGE_ANALYSIS_SCHEMA,
+    ) -> str:
+        """Send one image + ANALYSIS_PROMPT (plus extra_prompt) to Gemini,
+        constraining the reply to ``schema``.
+
+        Returns the raw JSON response text, or "" for an empty (e.g. blocked)
+        reply.
+        """
+        client = self._get_client()
+        prompt_cache = self._get_prompt_cache(client)
+        parts = [genai_types.Part.from_bytes(data=image_bytes, mime_type=mime_type)]
+        if prompt_cache is None:
+            parts.append(genai_types.Part.from_text(text=ANALYSIS_PROMPT + extra_prompt))
+        elif extra_prompt:
+            parts.append(genai_types.Part.from_text(text=extra_prompt))
+
+        response = self._generate_with_retry(
+            client,
+            model=self.model,
+            contents=[genai_types.Content(role="user", parts=parts)],
+            config=genai_types.GenerateContentConfig(
+                cached_content=prompt_cache,
+                temperature=0.1,  # Low temperature for consistent counting
+                max_output_tokens=4096,
+                response_mime_type="application/json",
+                response_schema=schema,
+            ),
+        )
+
+        # JSON mode returns bare JSON; an empty (e.g. blocked) reply falls
+        # through to the parse-failure path
+        return response.text or ""
 
     def analyze_page(
         self, img: Image.Image, page_number: int = 0
     ) -> PageAnalysis:
-        """Analyze a single drawing page for electrical symbols."""
-        client = self._get_client()
+        """Analyze a single drawing page for electrical symbols.
 
+        Identical page images (same bytes, prompt and model) are served from
+        an in-memory LRU cache instead of re-calling Gemini.
+        """
         # Convert image to bytes for API
-        buf = io.BytesIO()
-        img.save(buf, format="PNG")
-        image_bytes = buf.getvalue()
-
-        from google.genai import types
+        encoded = self._encode_image(img)
 
-        response = client.models.generate_content(
-            model=self.model,
-            contents=[
-                types.Content(
-                    parts=[
-                        types.Part.from_bytes(data=image_bytes, mime_type="image/png"),
-                        types.Part.from_text(text=ANALYSIS_PROMPT),
-                    ]
-                )
-            ],
-            config=types.GenerateContentConfig(
-                temperature=0.1,  # Low temperature for consistent counting
-                max_output_tokens=4096,
-            ),
-        )
+        cache_key = self._cache_key(encoded.digest)
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            return self._parse_response(cached, page_number)
 
-        raw_text = response.text.strip()
-        # Strip markdown code fences if present
-        if raw_text.startswith("```"):
-            raw_text = raw_text.split("\n", 1)[1]
-            if raw_text.endswith("```"):
-                raw_text = raw_text[:-3].strip()
+        raw_text = self._generate(encoded.data, encoded.mime_type)
 
-        return self._parse_response(raw_text, page_number)
+        analysis = self._parse_response(raw_text, page_number)
+        if analysis.page_type != "unknown":  # don't pin unparseable replies
+            self._cache_put(cache_key, raw_text)
+        return analysis
 
     def _parse_response(self, raw_text: str, page_number: int) -> PageAnalysis:
         """Parse the JSON response from the AI into structured data."""
         try:
-            data = json.loads(raw_text)
+            data = _json_loads(raw_text)
         except json.JSONDecodeError:
             return PageAnalysis(
                 page_number=page_number,
-                symbols=[],
                 page_type="unknown",
                 is_electrical=False,
                 raw_response=raw_text,
             )
+        return self._analysis_from_data(data, page_number, raw_text)
 
-        symbols = []
+    @staticmethod
+    def _analysis_from_data(
+        data: dict, page_number: int, raw_text: str
+    ) -> PageAnalysis:
+        """Build a PageAnalysis from one decoded page (or tile) object."""
+        table = SymbolTable()
         for sym in data.get("symbols", []):
-            symbols.append(
-                DetectedSymbol(
-                    symbol_type=sym.get("symbol_type", "unknown"),
-                    count=sym.get("count", 0),
-                    confidence=sym.get("confidence", 0.0),
-                    locations=sym.get("locations", []),
-                    notes=sym.get("notes", ""),
-                )
+            table.add(
+                sym.get("symbol_type", "unknown"),
+                sym.get("count", 0),
+                sym.get("confidence", 0.0),
+                sym.get("locations", []),
+                sym.get("notes", ""),
             )
 
         return PageAnalysis(
             page_number=page_number,
-            symbols=symbols,
+            table=table,
             page_type=data.get("page_type", "unknown"),
             is_electrical=data.get("is_electrical", False),
             raw_response=raw_text,
@@ -197,26 +501,158 @@ class ElectricalAnalyzer:
     def analyze_drawing_set(
         self, images: dict[int, Image.Image]
     ) -> list[PageAnalysis]:
-        """Analyze multiple pages from a drawing set."""
+        """Analyze multiple pages from a drawing set.
+
+        Pages are sent to Gemini concurrently (up to ``self.concurrency``
+        requests in flight); results are returned in page order.
+        """
+        pages = sorted(images.items())
+        if len(pages) <= 1 or self.concurrency == 1:
+            return [self.analyze_page(img, page_num) for page_num, img in pages]
+
+        # Encode every page up front (Pillow releases the GIL while
+        # encoding) so the network workers never stall on CPU work.
+        with ThreadPoolExecutor(max_workers=min(os.cpu_count() or 1, len(pages))) as pool:
+            list(pool.map(lambda item: self._encode_image(item[1]), pages))
+
+        return self._run_staggered(
+            lambda item: self.analyze_page(item[1], item[0]), pages
+        )
+
+    def _run_staggered(self, fn, items: list) -> list:
+        """Run fn over items on the request pool, results in input order.
+
+        Submissions are spaced by 60 / max_rpm seconds when a rate limit is
+        configured, instead of firing every request at once.
+        """
+        self._get_client()  # build once before fanning out
+        with ThreadPoolExecutor(max_workers=min(self.concurrency, len(items))) as pool:
+            futures = []
+            for i, item in enumerate(items):
+                if i and self._stagger_s:
+                    time.sleep(self._stagger_s)
+                futures.append(pool.submit(fn, item))
+            return [f.result() for f in futures]
+
+    def analyze_pages_batched(
+        self,
+        images: dict[int, Image.Image],
+        tile: int = 4,
+        min_tile_confidence: float = 0.6,
+    ) -> list[PageAnalysis]:
+        """Analyze a drawing set, tiling small pages ``tile`` at a time into
+        one composite image so several pages share a single Gemini request.
+
+        Only pages that fit a grid cell (max_edge / ceil(sqrt(tile)) on the
+        longest side) are tiled, so tiling never costs resolution. Larger
+        pages, and any tile whose result is missing or contains a symbol
+        below ``min_tile_confidence``, are analyzed individually. Results
+        are returned in page order.
+        """
+        pages = sorted(images.items())
+        if tile < 2 or not self.max_edge:
+            return self.analyze_drawing_set(images)
+
+        limit = self.max_edge // math.ceil(math.sqrt(tile))
+        small = [(n, img) for n, img in pages if max(img.size) <= limit]
+        work: list[list[tuple[int, Image.Image]]] = [
+            [(n, img)] for n, img in pages if max(img.size) > limit
+        ]
+        work += [small[i:i + tile] for i in range(0, len(small), tile)]
+
+        def run(group):
+            if len(group) == 1:
+                page_num, img = group[0]
+                return [self.analyze_page(img, page_num)]
+            return self._analyze_tile_group(group, min_tile_confidence)
+
+        if self.concurrency == 1 or len(work) <= 1:
+            batches = [run(group) for group in work]
+        else:
+            batches = self._run_staggered(run, work)
+
+        results = [analysis for batch in batches for analysis in batch]
+        results.sort(key=lambda a: a.page_number)
+        return results
+
+    def _analyze_tile_group(
+        self,
+        group: list[tuple[int, Image.Image]],
+        min_tile_confidence: float,
+    ) -> list[PageAnalysis]:
+        """Analyze 2+ small pages as one tiled composite image.
+
+        Composite replies share the response cache with analyze_page().
+        """
+        composite = self._tile_pages([img for _, img in group])
+        encoded = self._encode_image(composite)
+        cache_key = self._cache_key(encoded.digest, TILED_PROMPT_HASH)
+        raw_text = self._cache_get(cache_key)
+        fresh = raw_text is None
+        if fresh:
+            raw_text = self._generate(
+                encoded.data,
+                encoded.mime_type,
+                TILED_PROMPT_SUFFIX.format(n=len(group)),
+                schema=TILED_ANALYSIS_SCHEMA,
+            )
+
+        try:
+            tiles = _json_loads(raw_text).get("tiles", [])
+        except (json.JSONDecodeError, AttributeError):
+            tiles = []
+        if fresh and tiles:  # don't pin unparseable replies
+            self._cache_put(cache_key, raw_text)
+        by_index = {
+            t.get("tile_index"): t for t in tiles if isinstance(t, dict)
+        }
+
         results = []
-        for page_num, img in sorted(images.items()):
-            analysis = self.analyze_page(img, page_num)
+        for idx, (page_num, img) in enumerate(group):
+            tile_data = by_index.get(idx)
+            analysis = None
+            if tile_data is not None:
+                analysis = self._analysis_from_data(tile_data, page_num, raw_text)
+                if any(c < min_tile_confidence for c in analysis.table.confidences):
+                    analysis = None
+            if analysis is None:
+                # Tile missing or too uncertain — re-run that page on its own
+                analysis = self.analyze_page(img, page_num)
             results.append(analysis)
         return results
 
+    def _tile_pages(self, imgs: list[Image.Image]) -> Image.Image:
+        """Paste pages into a labelled grid no larger than max_edge square."""
+        cols = math.ceil(math.sqrt(len(imgs)))
+        rows = math.ceil(len(imgs) / cols)
+        cell = self.max_edge // cols
+        canvas = Image.new("RGB", (cell * cols, cell * rows), "white")
+        draw = ImageDraw.Draw(canvas)
+        try:
+            font = ImageFont.load_default(size=max(12, cell // 16))
+        except TypeError:  # Pillow < 10.1 has no sized default font
+            font = ImageFont.load_default()
+
+        for i, img in enumerate(imgs):
+            x, y = (i % cols) * cell, (i // cols) * cell
+            page = img.convert("RGB")
+            page.thumbnail((cell, cell), Image.LANCZOS)
+            canvas.paste(page, (x, y))
+            draw.rectangle([x, y, x + cell - 1, y + cell - 1], outline="black", width=2)
+            draw.text((x + 6, y + 4), f"#{i}", fill="red", font=font)
+        return canvas
+
 
 def aggregate_counts(analyses: list[PageAnalysis]) -> dict[str, int]:
     """Aggregate symbol counts across all electrical pages."""
-    totals: dict[str, int] = {}
+    totals: Counter[str] = Counter()
     for analysis in analyses:
         if not analysis.is_electrical:
             continue
-        for sym in analysis.symbols:
-            if sym.symbol_type in totals:
-                totals[sym.symbol_type] += sym.count
-            else:
-                totals[sym.symbol_type] = sym.count
-    return totals
+        table = analysis.table
+        for symbol_type, count in zip(table.types, table.counts):
+            totals[symbol_type] += count
+    return dict(totals)
 
 
 def get_low_confidence_items(
@@ -225,7 +661,8 @@ def get_low_confidence_items(
     """Return items below confidence threshold for user review."""
     flagged = []
     for analysis in analyses:
-        for sym in analysis.symbols:
-            if sym.confidence < threshold:
-                flagged.append((analysis.page_number, sym))
+        table = analysis.table
+        for i, confidence in enumerate(table.confidences):
+            if confidence < threshold:
+                flagged.append((analysis.page_number, table.row(i)))
     return flagged
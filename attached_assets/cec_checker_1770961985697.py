@@ -5,10 +5,37 @@ and generates a report of violations, warnings, and passes.
 """
 
 from __future__ import annotations
-from dataclasses import dataclass, field
-
-
-@dataclass
+from collections import Counter
+from dataclasses import dataclass, field, replace
+from functools import lru_cache
+from typing import NamedTuple
+
+
+# Device groupings used by the whole-house totals checks
+SWITCH_TYPES = frozenset({
+    "single_pole_switch", "three_way_switch", "four_way_switch", "dimmer_switch",
+})
+# Lights expected to have switch control (switch/light ratio check)
+SWITCHED_LIGHT_TYPES = frozenset({
+    "recessed_light", "surface_mount_light", "pendant_light", "track_lighting",
+    "fluorescent_light", "ceiling_fan_light", "under_cabinet_light",
+})
+# Lights counted toward general-purpose circuit loading
+LOAD_LIGHT_TYPES = frozenset({
+    "recessed_light", "surface_mount_light", "pendant_light", "track_lighting",
+    "fluorescent_light",
+})
+RECEPTACLE_TYPES = frozenset({
+    "duplex_receptacle", "gfci_receptacle", "dedicated_receptacle",
+    "outdoor_receptacle",
+})
+
+# Room-type groupings
+BEDROOMS = frozenset({"bedroom", "primary_bedroom"})
+BATHROOMS = frozenset({"bathroom", "ensuite"})
+
+
+@dataclass(slots=True)
 class CheckResult:
     """A single compliance check result."""
     severity: str          # "FAIL", "WARNING", "PASS", "INFO"
@@ -18,7 +45,7 @@ class CheckResult:
     recommendation: str    # what to fix
 
 
-@dataclass
+@dataclass(slots=True)
 class ComplianceReport:
     """Full CEC compliance report."""
     total_checks: int
@@ -29,6 +56,12 @@ class ComplianceReport:
     score_pct: float  # 0-100 compliance score
 
 
+class _RoomKey(NamedTuple):
+    """The DetectedRoom fields the checks read — hashable for memoization."""
+    room_type: str
+    room_name: str
+
+
 def check_compliance(
     symbol_counts: dict[str, int],
     detected_rooms: list,
@@ -36,6 +69,10 @@ def check_compliance(
 ) -> ComplianceReport:
     """Run CEC 2021 compliance checks against the estimate.
 
+    Reports are memoized on (counts, room types/names, dwelling type), so
+    UI re-renders with unchanged inputs — including the empty estimate —
+    skip the checks entirely.
+
     Args:
         symbol_counts: device type -> quantity
         detected_rooms: list of DetectedRoom objects
@@ -44,10 +81,30 @@ def check_compliance(
     Returns:
         ComplianceReport with all check results
     """
+    report = _check_compliance_cached(
+        frozenset(symbol_counts.items()),
+        tuple(_RoomKey(r.room_type, r.room_name) for r in detected_rooms),
+        dwelling_type,
+    )
+    # Fresh results so callers can't mutate the cached report
+    return replace(report, results=[replace(r) for r in report.results])
+
+
+@lru_cache(maxsize=32)
+def _check_compliance_cached(
+    counts_key: frozenset,
+    rooms_key: tuple[_RoomKey, ...],
+    dwelling_type: str,
+) -> ComplianceReport:
+    symbol_counts = dict(counts_key)
+    detected_rooms = rooms_key
     results: list[CheckResult] = []
+    buckets = _bucket_totals(symbol_counts)
+    room_type_counts = Counter(r.room_type for r in detected_rooms)
+    bedroom_count = sum(room_type_counts[t] for t in BEDROOMS)
 
     # ── Whole-House Checks ──
-    _check_smoke_detectors(results, symbol_counts, detected_rooms)
+    _check_smoke_detectors(results, symbol_counts, bedroom_count)
     _check_panel(results, symbol_counts)
     _check_outdoor_receptacle(results, symbol_counts)
     _check_exterior_lighting(results, symbol_counts)
@@ -59,11 +116,12 @@ def check_compliance(
     from sparkestimate.core.room_detector import CEC_ROOM_REQUIREMENTS
 
     for room in detected_rooms:
-        req = CEC_ROOM_REQUIREMENTS.get(room.room_type)
+        room_type = room.room_type
+        req = CEC_ROOM_REQUIREMENTS.get(room_type)
         if not req:
             continue
 
-        room_label = f"{room.room_name} ({room.room_type.replace('_', ' ').title()})"
+        room_label = _room_label(room.room_name, room_type)
 
         # Check GFCI where required
         if req.needs_gfci:
@@ -74,31 +132,31 @@ def check_compliance(
             _check_room_exhaust(results, symbol_counts, room, room_label)
 
         # Check bathroom-specific rules
-        if room.room_type in ("bathroom", "ensuite"):
+        if room_type in BATHROOMS:
             _check_bathroom_rules(results, symbol_counts, room, room_label)
 
         # Check kitchen-specific rules
-        if room.room_type == "kitchen":
+        elif room_type == "kitchen":
             _check_kitchen_rules(results, symbol_counts, room, room_label)
 
         # Check garage rules
-        if room.room_type == "garage":
+        elif room_type == "garage":
             _check_garage_rules(results, symbol_counts, room, room_label)
 
     # ── Switch/Light Checks ──
-    _check_switch_light_ratio(results, symbol_counts)
+    _check_switch_light_ratio(results, buckets)
 
     # ── AFCI Checks ──
-    _check_afci_coverage(results, symbol_counts, detected_rooms)
+    _check_afci_coverage(results, bedroom_count)
 
     # ── Circuit Load Checks ──
-    _check_circuit_loading(results, symbol_counts, detected_rooms)
+    _check_circuit_loading(results, buckets)
 
     # Calculate score — INFO items are reminders, not scored checks
-    infos = sum(1 for r in results if r.severity == "INFO")
-    passes = sum(1 for r in results if r.severity == "PASS")
-    warnings = sum(1 for r in results if r.severity == "WARNING")
-    failures = sum(1 for r in results if r.severity == "FAIL")
+    tally = Counter(r.severity for r in results)
+    passes = tally["PASS"]
+    warnings = tally["WARNING"]
+    failures = tally["FAIL"]
     scored_checks = passes + warnings + failures  # exclude INFO
     score = (passes / scored_checks * 100) if scored_checks > 0 else 100
 
@@ -112,13 +170,26 @@ def check_compliance(
     )
 
 
+def _bucket_totals(counts: dict[str, int]) -> dict[str, int]:
+    """Sum device counts per category once for all whole-house checks."""
+    keys = counts.keys()
+    return {
+        "switches": sum(counts[t] for t in keys & SWITCH_TYPES),
+        "switched_lights": sum(counts[t] for t in keys & SWITCHED_LIGHT_TYPES),
+        "load_lights": sum(counts[t] for t in keys & LOAD_LIGHT_TYPES),
+        "receptacles": sum(counts[t] for t in keys & RECEPTACLE_TYPES),
+    }
+
+
+@lru_cache(maxsize=256)
+def _room_label(room_name: str, room_type: str) -> str:
+    return f"{room_name} ({room_type.replace('_', ' ').title()})"
+
+
 # ─── Whole-House Checks ───
 
-def _check_smoke_detectors(results, counts, rooms):
+def _check_smoke_detectors(results, counts, bedroom_count):
     """CEC 32-110 / NBC: Smoke alarms in each bedroom + outside sleeping areas."""
-    bedroom_count = sum(
-        1 for r in rooms if r.room_type in ("bedroom", "primary_bedroom")
-    )
     # Need smoke in each bedroom + at least one per floor with bedrooms
     # Plus hallways outside sleeping areas
     min_smoke = max(bedroom_count + 1, 3)  # at minimum 3 for any house
@@ -267,11 +338,6 @@ def _check_data_outlets(results, counts, rooms):
 def _check_room_gfci(results, counts, room, room_label):
     """Check GFCI protection for rooms that need it."""
     gfci_count = counts.get("gfci_receptacle", 0)
-    rooms_needing_gfci = sum(
-        1 for r in [room]
-        if r.room_type in ("bathroom", "ensuite", "powder_room", "kitchen",
-                            "garage", "laundry_room", "mudroom")
-    )
     if gfci_count > 0:
         results.append(CheckResult(
             "PASS", "CEC 26-700",
@@ -365,21 +431,10 @@ def _check_garage_rules(results, counts, room, room_label):
 
 # ─── General Checks ───
 
-def _check_switch_light_ratio(results, counts):
+def _check_switch_light_ratio(results, buckets):
     """Sanity check: switches should roughly correlate with lights."""
-    total_lights = sum(
-        counts.get(t, 0) for t in (
-            "recessed_light", "surface_mount_light", "pendant_light",
-            "track_lighting", "fluorescent_light", "ceiling_fan_light",
-            "under_cabinet_light",
-        )
-    )
-    total_switches = sum(
-        counts.get(t, 0) for t in (
-            "single_pole_switch", "three_way_switch", "four_way_switch",
-            "dimmer_switch",
-        )
-    )
+    total_lights = buckets["switched_lights"]
+    total_switches = buckets["switches"]
 
     if total_lights == 0 and total_switches == 0:
         return
@@ -408,11 +463,8 @@ def _check_switch_light_ratio(results, counts):
         ))
 
 
-def _check_afci_coverage(results, counts, rooms):
+def _check_afci_coverage(results, bedroom_count):
     """CEC 26-656: AFCI required for bedroom circuits."""
-    bedroom_count = sum(
-        1 for r in rooms if r.room_type in ("bedroom", "primary_bedroom")
-    )
     if bedroom_count == 0:
         return
 
@@ -424,20 +476,10 @@ def _check_afci_coverage(results, counts, rooms):
     ))
 
 
-def _check_circuit_loading(results, counts, rooms):
+def _check_circuit_loading(results, buckets):
     """Basic circuit loading sanity check."""
-    total_receptacles = sum(
-        counts.get(t, 0) for t in (
-            "duplex_receptacle", "gfci_receptacle", "dedicated_receptacle",
-            "outdoor_receptacle",
-        )
-    )
-    total_lights = sum(
-        counts.get(t, 0) for t in (
-            "recessed_light", "surface_mount_light", "pendant_light",
-            "track_lighting", "fluorescent_light",
-        )
-    )
+    total_receptacles = buckets["receptacles"]
+    total_lights = buckets["load_lights"]
 
     # Rule of thumb: max 12 devices per 15A circuit
     estimated_circuits_needed = (total_receptacles + total_lights) // 12 + 1
@@ -0,0 +1,59 @@
+"""Process-wide Gemini clients shared by the drawing analyzer and room detector.
+
+One client (and its pooled keep-alive HTTP connections) per API key, so
+every analyzer instance and worker thread reuses the same TLS sessions.
+"""
+
+import importlib.util
+import threading
+
+try:
+    import httpx  # installed with google-genai
+    from google import genai
+    from google.genai import types as genai_types
+except ImportError:  # only needed once a Gemini request is made
+    httpx = None
+    genai = None
+    genai_types = None
+
+# Smallest keep-alive pool a shared client is built with
+MIN_POOL_CONNECTIONS = 10
+
+# api_key -> (client, pool size it was built with)
+_CLIENTS: dict[str, tuple["genai.Client", int]] = {}
+_CLIENTS_LOCK = threading.Lock()
+
+
+def shared_client(api_key: str, concurrency: int = 1):
+    """Return the process-wide Gemini client for api_key.
+
+    The connection pool is sized for the largest ``concurrency`` requested
+    so far: a caller needing more connections than the current client has
+    gets a larger replacement, which later callers then share.
+    """
+    pool = max(concurrency * 2, MIN_POOL_CONNECTIONS)
+    entry = _CLIENTS.get(api_key)
+    if entry is not None and entry[1] >= pool:
+        return entry[0]
+    with _CLIENTS_LOCK:
+        entry = _CLIENTS.get(api_key)
+        if entry is not None and entry[1] >= pool:
+            return entry[0]
+        if genai is None:
+            raise ImportError(
+                "google-genai is required for drawing analysis "
+                "(pip install google-genai)"
+            )
+        client_args = {
+            "limits": httpx.Limits(
+                max_connections=pool, max_keepalive_connections=pool
+            ),
+            # Multiplex parallel requests over one TLS session if h2 is installed
+            "http2": importlib.util.find_spec("h2") is not None,
+        }
+        client = genai.Client(
+            api_key=api_key,
+            http_options=genai_types.HttpOptions(client_args=client_args),
+        )
+        _CLIENTS[api_key] = (client, pool)
+    return client
@@ -4,10 +4,15 @@ Generates a complete breaker panel layout from device counts and detected rooms.
 Follows CEC rules for dedicated circuits, GFCI/AFCI protection, and load calculation.
 """
 
-from dataclasses import dataclass, field
+import sys
+from bisect import bisect_left, bisect_right
+from collections import Counter, defaultdict
+from dataclasses import dataclass, field, replace
+from functools import lru_cache
+from types import MappingProxyType
 
 
-@dataclass
+@dataclass(slots=True, repr=False)
 class CircuitBreaker:
     """A single circuit breaker in the panel."""
     circuit_number: int
@@ -21,8 +26,18 @@ class CircuitBreaker:
     load_watts: int = 0
     room: str = ""
 
+    def __repr__(self) -> str:
+        return (f"CB#{self.circuit_number} {self.amperage}A/{self.poles}P "
+                f"{self.description}")
 
-@dataclass
+    def as_tuple(self) -> tuple:
+        """Plain field tuple, in declaration order (for CSV/JSON export)."""
+        return (self.circuit_number, self.amperage, self.poles,
+                self.description, self.wire_type, self.is_gfci, self.is_afci,
+                self.device_count, self.load_watts, self.room)
+
+
+@dataclass(slots=True)
 class PanelSchedule:
     """Complete panel schedule for a dwelling unit."""
     panel_size_amps: int
@@ -39,8 +54,9 @@ class PanelSchedule:
     notes: list[str] = field(default_factory=list)
 
 
-# Standard watt loads per device for demand calculation
-DEVICE_WATTS = {
+# Standard watt loads per device for demand calculation (read-only; copy
+# with dict(DEVICE_WATTS) to customize)
+DEVICE_WATTS = MappingProxyType({
     "duplex_receptacle": 180,
     "gfci_receptacle": 180,
     "weather_resistant_receptacle": 180,
@@ -72,13 +88,67 @@ DEVICE_WATTS = {
     "phone_outlet": 0,
     "cable_tv_outlet": 0,
     "panel_board": 0,
-}
+})
 
 # Max outlets per 15A circuit (CEC Rule 12-3000)
 MAX_PER_15A = 12
 MAX_PER_20A = 12
 
 
+class _Numbered:
+    """Numbered circuit labels ("... #1", "#2", ...), prebuilt for the
+    common counts and formatted on demand past that."""
+
+    __slots__ = ("fmt", "labels")
+
+    def __init__(self, fmt: str, prebuilt: int = 8):
+        self.fmt = fmt
+        self.labels = tuple(fmt.format(n) for n in range(1, prebuilt + 1))
+
+    def __getitem__(self, i: int) -> str:
+        labels = self.labels
+        return labels[i] if i < len(labels) else self.fmt.format(i + 1)
+
+
+_COUNTER_SPLIT = _Numbered("Kitchen Counter Split #{} (CEC 26-724)")
+_BASEBOARD_HEAT = _Numbered("Baseboard Heat #{}")
+_GENERAL_LIGHTING = _Numbered("General Lighting #{} (AFCI)")
+_BEDROOM_RECEPTS = _Numbered("Bedroom Receptacles #{} (AFCI)")
+_GENERAL_RECEPTS = _Numbered("General Receptacles #{} (AFCI)")
+
+# Devices folded into shared circuits (consumed in this order)
+_LOW_VOLTAGE_TYPES = (
+    "doorbell", "thermostat", "data_outlet", "phone_outlet", "cable_tv_outlet",
+)
+_LIGHTING_TYPES = (
+    "recessed_light", "surface_mount_light", "pendant_light",
+    "ceiling_fan", "track_light", "fluorescent_light",
+)
+_LIGHTING_CONTROL_TYPES = (
+    "single_pole_switch", "three_way_switch", "four_way_switch",
+    "dimmer_switch", "occupancy_sensor",
+)
+
+# Wire types, interned once so every breaker shares the same string object
+# (cheap identity hits when tallying by wire type for the BoM)
+_WIRE_14_2 = sys.intern("14/2 NM-B")
+_WIRE_14_3 = sys.intern("14/3 NM-B")
+_WIRE_12_2 = sys.intern("12/2 NM-B")
+_WIRE_10_2 = sys.intern("10/2 NM-B")
+_WIRE_10_3 = sys.intern("10/3 NM-B")
+_WIRE_6_3 = sys.intern("6/3 NM-B")
+_NO_WIRE = sys.intern("—")
+
+# Unconditional breakers as add() argument tuples:
+# (amps, poles, desc, wire, gfci, afci, count, watts, room)
+_FURNACE = (15, 1, "Furnace / Air Handler (dedicated)", _WIRE_14_2,
+            False, False, 1, 600, "Mechanical")
+_SPARES = (
+    (15, 1, "Spare #1", _NO_WIRE, False, False, 0, 0, ""),
+    (15, 1, "Spare #2", _NO_WIRE, False, False, 0, 0, ""),
+)
+
+
 def generate_panel_schedule(
     symbol_counts: dict[str, int],
     detected_rooms: list = None,
@@ -90,6 +160,9 @@ def generate_panel_schedule(
 ) -> PanelSchedule:
     """Generate a CEC-compliant panel schedule from device counts and rooms.
 
+    Schedules are memoized on (counts, room-type counts, options); only the
+    rooms' types affect the layout.
+
     Args:
         symbol_counts: device type -> count dict
         detected_rooms: list of DetectedRoom objects (optional)
@@ -102,39 +175,150 @@ def generate_panel_schedule(
     Returns:
         PanelSchedule with all circuits assigned.
     """
-    circuits = []
-    next_num = [1]  # mutable counter
+    if not symbol_counts and not detected_rooms:
+        # Initial/empty UI state — skip canonicalizing, straight to the cache
+        counts_key = room_types_key = _NO_ITEMS
+    else:
+        # Interned so lookups against the (already interned) literal room
+        # types below match on identity
+        room_types = Counter(
+            sys.intern(getattr(r, 'room_type', '')) for r in detected_rooms or []
+        )
+        counts_key = frozenset(symbol_counts.items())
+        room_types_key = frozenset(room_types.items())
+    schedule = _generate_cached(
+        counts_key,
+        room_types_key,
+        dwelling_type,
+        has_electric_range,
+        has_ac,
+        has_electric_heat,
+        total_sqft,
+    )
+    # Fresh circuits/notes so callers can't mutate the cached schedule
+    return replace(
+        schedule,
+        circuits=[replace(c) for c in schedule.circuits],
+        notes=list(schedule.notes),
+    )
+
+
+def generate_panel_schedule_batch(jobs) -> list[PanelSchedule]:
+    """Generate panel schedules for many units in one call.
+
+    Args:
+        jobs: iterable of (symbol_counts, detected_rooms, options, total_sqft)
+            tuples, where options is a dict of generate_panel_schedule
+            keyword arguments (dwelling_type, has_ac, ...); the job's
+            total_sqft takes precedence over one given in options
+
+    Returns:
+        One PanelSchedule per job, in order. Identical units (common in
+        multi-unit projects) are generated once and copied.
+    """
+    generate = generate_panel_schedule
+    return [
+        generate(counts, rooms, **{**(options or {}), "total_sqft": sqft})
+        for counts, rooms, options, sqft in jobs
+    ]
+
+
+_NO_ITEMS: frozenset = frozenset()
+
+
+# ── Load calculation (CEC Rule 8-200) ──
+
+# Panel size by calculated service amps: ≤100A → 100, ≤125A → 125, else 200
+_PANEL_BREAKS = (100.0, 125.0)
+_PANEL_AMPS = (100, 125, 200)
+# Breaker spaces by panel size: <125A → 20, <200A → 30, else 40
+_SPACE_BREAKS = (125, 200)
+_SPACES = (20, 30, 40)
+
+
+def _sum_loads(circuits: list[CircuitBreaker]) -> tuple[int, int, int, int]:
+    """One pass: (connected load, basic load, large load, spaces used).
+
+    Basic loads are ≤20A single-pole circuits; large loads are 2-pole or
+    ≥30A circuits.
+    """
+    total_load = basic_load = large_load = spaces_used = 0
+    for c in circuits:
+        watts = c.load_watts
+        poles = c.poles
+        total_load += watts
+        spaces_used += poles
+        if poles == 2 or c.amperage >= 30:
+            large_load += watts
+        elif poles == 1 and c.amperage <= 20:
+            basic_load += watts
+    return total_load, basic_load, large_load, spaces_used
+
+
+def _size_service(
+    basic_load: int, large_load: int, force_200a: bool
+) -> tuple[int, float, int, int]:
+    """Demand and panel sizing: (demand W, service A, panel A, spaces).
+
+    Pure arithmetic on the summed loads, kept separate from circuit
+    allocation so it can be reused per unit in bulk runs.
+    """
+    # CEC demand calculation
+    # Basic load: first 5000W at 100%, remainder at 25%
+    demand_basic = min(basic_load, 5000) + max(0, basic_load - 5000) * 0.25
+
+    # Large appliances at 100%
+    total_demand = int(demand_basic + large_load)
+    service_amps = total_demand / 240.0
+
+    # Determine panel size
+    panel_amps = _PANEL_AMPS[bisect_left(_PANEL_BREAKS, service_amps)]
+
+    # Modern homes (>1500 sqft, A/C or electric heat) default to 200A
+    if force_200a:
+        panel_amps = max(panel_amps, 200)
+
+    spaces_total = _SPACES[bisect_right(_SPACE_BREAKS, panel_amps)]
+    return total_demand, service_amps, panel_amps, spaces_total
+
+
+# ── Circuit allocation ──
+
+@lru_cache(maxsize=256)
+def _generate_cached(
+    counts_key: frozenset,
+    room_types_key: frozenset,
+    dwelling_type: str,
+    has_electric_range: bool,
+    has_ac: bool,
+    has_electric_heat: bool,
+    total_sqft: float,
+) -> PanelSchedule:
+    symbol_counts = dict(counts_key)
+    room_types = Counter(dict(room_types_key))
+    make_breaker = CircuitBreaker
+    circuits = []  # never more than spaces_total (≤40) entries
+    append_circuit = circuits.append
+    next_num = 1
 
     def add(amps, poles, desc, wire="", gfci=False, afci=False,
             count=0, watts=0, room=""):
-        cb = CircuitBreaker(
-            circuit_number=next_num[0],
-            amperage=amps,
-            poles=poles,
-            description=desc,
-            wire_type=wire,
-            is_gfci=gfci,
-            is_afci=afci,
-            device_count=count,
-            load_watts=watts,
-            room=room,
-        )
-        circuits.append(cb)
-        next_num[0] += poles
+        nonlocal next_num
+        # Positional, in CircuitBreaker field order
+        cb = make_breaker(next_num, amps, poles, desc, wire, gfci, afci,
+                          count, watts, room)
+        append_circuit(cb)
+        next_num += poles
         return cb
 
-    rooms = detected_rooms or []
-    room_types = {getattr(r, 'room_type', '') for r in rooms}
-
     # Track which devices are assigned to dedicated circuits
-    remaining = dict(symbol_counts)
+    remaining = defaultdict(int, symbol_counts)
 
     def consume(sym, count=None):
         """Remove devices from remaining pool."""
-        if count is None:
-            count = remaining.get(sym, 0)
-        actual = min(count, remaining.get(sym, 0))
-        remaining[sym] = remaining.get(sym, 0) - actual
+        have = remaining[sym]
+        actual = have if count is None or count >= have else count
+        remaining[sym] = have - actual
         return actual
 
     # ═══════════════════════════════════════════════
@@ -145,48 +329,45 @@ def generate_panel_schedule(
     has_kitchen = "kitchen" in room_types or kitchen_gfci > 0
 
     if has_kitchen:
-        # Counter split circuits — min 2, each serves up to 3 GFCI outlets
+        # Counter split circuits — min 2, each serves up to 3 GFCI outlets.
+        # CEC 26-724 requires both splits even before any GFCIs are placed,
+        # so empty kitchens still get them; just skip the no-op consumes.
         counter_gfci = min(kitchen_gfci, 6)  # kitchen counter GFCIs
         split_count = max(2, (counter_gfci + 2) // 3)
         for i in range(split_count):
-            devs = min(3, counter_gfci - i * 3)
-            if devs <= 0:
-                devs = 0
-            n = consume("gfci_receptacle", devs)
-            add(20, 1, f"Kitchen Counter Split #{i+1} (CEC 26-724)",
-                wire="12/2 NM-B", gfci=True, count=n,
+            devs = counter_gfci - i * 3
+            n = consume("gfci_receptacle", min(devs, 3)) if devs > 0 else 0
+            add(20, 1, _COUNTER_SPLIT[i],
+                wire=_WIRE_12_2, gfci=True, count=n,
                 watts=n * 180, room="Kitchen")
 
         # Refrigerator dedicated
         n = consume("dedicated_receptacle", 1)
         add(15, 1, "Refrigerator Dedicated",
-            wire="14/2 NM-B", count=1, watts=1500, room="Kitchen")
+            wire=_WIRE_14_2, count=1, watts=1500, room="Kitchen")
 
         # Dishwasher dedicated
         add(15, 1, "Dishwasher Dedicated",
-            wire="14/2 NM-B", gfci=True, count=1, watts=1200, room="Kitchen")
+            wire=_WIRE_14_2, gfci=True, count=1, watts=1200, room="Kitchen")
 
         # Range hood / Microwave
         if symbol_counts.get("range_hood_fan", 0) > 0:
             consume("range_hood_fan", 1)
             add(20, 1, "Range Hood / Microwave",
-                wire="12/2 NM-B", count=1, watts=1500, room="Kitchen")
+                wire=_WIRE_12_2, count=1, watts=1500, room="Kitchen")
 
     # ═══════════════════════════════════════════════
     # 2. BATHROOM CIRCUIT (CEC 26-720(f))
     # ═══════════════════════════════════════════════
 
-    bathroom_count = sum(
-        1 for r in rooms
-        if getattr(r, 'room_type', '') in ("bathroom", "powder_room")
-    )
+    bathroom_count = room_types["bathroom"] + room_types["powder_room"]
     if bathroom_count > 0 or symbol_counts.get("exhaust_fan", 0) > 0:
         # Shared 20A GFCI for all bathrooms
         bath_gfci = consume("gfci_receptacle")  # remaining bath GFCIs
         bath_exhaust = consume("exhaust_fan", bathroom_count)
         consume("exhaust_fan_bathroom", bathroom_count)
         add(20, 1, f"Bathroom(s) GFCI — {bathroom_count or 1} bathroom(s)",
-            wire="12/2 NM-B", gfci=True,
+            wire=_WIRE_12_2, gfci=True,
             count=bath_gfci + bath_exhaust,
             watts=(bath_gfci * 180) + (bath_exhaust * 100),
             room="Bathrooms")
@@ -200,12 +381,12 @@ def generate_panel_schedule(
         # Laundry receptacle — 20A dedicated
         consume("duplex_receptacle", 2)
         add(20, 1, "Laundry Receptacle (dedicated)",
-            wire="12/2 NM-B", count=2, watts=1500, room="Laundry")
+            wire=_WIRE_12_2, count=2, watts=1500, room="Laundry")
 
         # Dryer — 30A 2-pole (CEC 26-744)
         if consume("dryer_outlet", 1):
             add(30, 2, "Dryer 240V (CEC 26-744)",
-                wire="10/3 NM-B", count=1, watts=5000, room="Laundry")
+                wire=_WIRE_10_3, count=1, watts=5000, room="Laundry")
 
     # ═══════════════════════════════════════════════
     # 4. RANGE / OVEN — 40A 2-pole
@@ -213,7 +394,7 @@ def generate_panel_schedule(
 
     if has_electric_range and has_kitchen:
         add(40, 2, "Range/Oven 240V (CEC 26-744)",
-            wire="6/3 NM-B", count=1, watts=8000, room="Kitchen")
+            wire=_WIRE_6_3, count=1, watts=8000, room="Kitchen")
 
     # ═══════════════════════════════════════════════
     # 5. A/C — 30A 2-pole (if present)
@@ -221,7 +402,7 @@ def generate_panel_schedule(
 
     if has_ac:
         add(30, 2, "Central A/C 240V",
-            wire="10/2 NM-B", count=1, watts=3600, room="Exterior")
+            wire=_WIRE_10_2, count=1, watts=3600, room="Exterior")
 
     # ═══════════════════════════════════════════════
     # 6. ELECTRIC HEAT (if present)
@@ -232,8 +413,8 @@ def generate_panel_schedule(
         heat_watts = max(total_sqft * 10, 5000)  # ~10W per sqft
         heat_circuits = max(1, int(heat_watts / 3600 + 0.5))
         for i in range(heat_circuits):
-            add(20, 2, f"Baseboard Heat #{i+1}",
-                wire="12/2 NM-B", count=1, watts=3600, room="Various")
+            add(20, 2, _BASEBOARD_HEAT[i],
+                wire=_WIRE_12_2, count=1, watts=3600, room="Various")
 
     # ═══════════════════════════════════════════════
     # 7. EV CHARGER (if present)
@@ -241,22 +422,18 @@ def generate_panel_schedule(
 
     if consume("ev_charger"):
         add(40, 2, "EV Charger 240V (dedicated)",
-            wire="6/3 NM-B", count=1, watts=7200, room="Garage")
+            wire=_WIRE_6_3, count=1, watts=7200, room="Garage")
 
     # ═══════════════════════════════════════════════
     # 8. GARAGE — 20A GFCI dedicated (CEC 26-724)
     # ═══════════════════════════════════════════════
 
-    has_garage = "garage" in room_types
-    garage_recepts = 0
-    if has_garage:
-        garage_recepts = sum(
-            1 for r in rooms
-            if getattr(r, 'room_type', '') == "garage"
-        ) * 3  # ~3 outlets per garage space
+    garage_count = room_types["garage"]
+    if garage_count:
+        garage_recepts = garage_count * 3  # ~3 outlets per garage space
         n = consume("duplex_receptacle", garage_recepts)
         add(20, 1, "Garage GFCI (dedicated)",
-            wire="12/2 NM-B", gfci=True, count=n,
+            wire=_WIRE_12_2, gfci=True, count=n,
             watts=n * 180, room="Garage")
 
     # ═══════════════════════════════════════════════
@@ -267,7 +444,7 @@ def generate_panel_schedule(
     ext_lights = consume("exterior_light")
     if outdoor > 0 or ext_lights > 0:
         add(20, 1, "Outdoor / Exterior GFCI",
-            wire="12/2 NM-B", gfci=True,
+            wire=_WIRE_12_2, gfci=True,
             count=outdoor + ext_lights,
             watts=outdoor * 180 + ext_lights * 100,
             room="Exterior")
@@ -279,51 +456,39 @@ def generate_panel_schedule(
     smoke = consume("smoke_co_combo") + consume("smoke_detector") + consume("co_detector")
     if smoke > 0:
         add(15, 1, "Smoke/CO Detectors (interconnected)",
-            wire="14/3 NM-B", count=smoke, watts=smoke * 5,
+            wire=_WIRE_14_3, count=smoke, watts=smoke * 5,
             room="Whole House")
 
     # ═══════════════════════════════════════════════
     # 11. FURNACE — 15A dedicated
     # ═══════════════════════════════════════════════
 
-    add(15, 1, "Furnace / Air Handler (dedicated)",
-        wire="14/2 NM-B", count=1, watts=600, room="Mechanical")
+    add(*_FURNACE)
 
     # ═══════════════════════════════════════════════
     # 12. DOORBELL / LOW VOLTAGE — shared with lighting
     # ═══════════════════════════════════════════════
 
-    consume("doorbell")
-    consume("thermostat")
-    consume("data_outlet")
-    consume("phone_outlet")
-    consume("cable_tv_outlet")
+    for sym in _LOW_VOLTAGE_TYPES:
+        consume(sym)
 
     # ═══════════════════════════════════════════════
     # 13. GENERAL LIGHTING — 15A circuits, max 12 per
     # ═══════════════════════════════════════════════
 
-    lighting_types = [
-        "recessed_light", "surface_mount_light", "pendant_light",
-        "ceiling_fan", "track_light", "fluorescent_light",
-    ]
-    total_lights = sum(consume(lt) for lt in lighting_types)
+    total_lights = sum(map(consume, _LIGHTING_TYPES))
     # Consume switches too (they share lighting circuits)
-    consume("single_pole_switch")
-    consume("three_way_switch")
-    consume("four_way_switch")
-    consume("dimmer_switch")
-    consume("occupancy_sensor")
+    for sym in _LIGHTING_CONTROL_TYPES:
+        consume(sym)
 
     if total_lights > 0:
         light_circuits = max(1, (total_lights + MAX_PER_15A - 1) // MAX_PER_15A)
-        per_circuit = (total_lights + light_circuits - 1) // light_circuits
+        # Spread evenly: the first `extra` circuits take one more device
+        base, extra = divmod(total_lights, light_circuits)
         for i in range(light_circuits):
-            count = min(per_circuit, total_lights - i * per_circuit)
-            if count <= 0:
-                break
-            add(15, 1, f"General Lighting #{i+1} (AFCI)",
-                wire="14/2 NM-B", afci=True, count=count,
+            count = base + 1 if i < extra else base
+            add(15, 1, _GENERAL_LIGHTING[i],
+                wire=_WIRE_14_2, afci=True, count=count,
                 watts=count * 85, room="Various")
 
     # ═══════════════════════════════════════════════
@@ -336,87 +501,47 @@ def generate_panel_schedule(
     gen_recepts += consume("dedicated_receptacle")
 
     if gen_recepts > 0:
-        recept_circuits = max(1, (gen_recepts + MAX_PER_15A - 1) // MAX_PER_15A)
-        per_circuit = (gen_recepts + recept_circuits - 1) // recept_circuits
-
         # Try to separate bedroom circuits (AFCI required)
-        bedroom_rooms = [
-            r for r in rooms
-            if getattr(r, 'room_type', '') in ("bedroom", "primary_bedroom")
-        ]
+        bedroom_count = room_types["bedroom"] + room_types["primary_bedroom"]
 
         # Bedroom circuits first
-        if bedroom_rooms and gen_recepts > 6:
-            bed_count = min(gen_recepts // 2, len(bedroom_rooms) * 4)
+        if bedroom_count and gen_recepts > 6:
+            bed_count = min(gen_recepts // 2, bedroom_count * 4)
             bed_circuits = max(1, (bed_count + MAX_PER_15A - 1) // MAX_PER_15A)
+            base, extra = divmod(bed_count, bed_circuits)
             for i in range(bed_circuits):
-                count = min(per_circuit, bed_count - i * per_circuit)
-                if count <= 0:
-                    break
+                count = base + 1 if i < extra else base
                 gen_recepts -= count
-                add(15, 1, f"Bedroom Receptacles #{i+1} (AFCI)",
-                    wire="14/2 NM-B", afci=True, count=count,
+                add(15, 1, _BEDROOM_RECEPTS[i],
+                    wire=_WIRE_14_2, afci=True, count=count,
                     watts=count * 180, room="Bedrooms")
 
         # Remaining general receptacles
         if gen_recepts > 0:
             rem_circuits = max(1, (gen_recepts + MAX_PER_15A - 1) // MAX_PER_15A)
-            per_c = (gen_recepts + rem_circuits - 1) // rem_circuits
+            base, extra = divmod(gen_recepts, rem_circuits)
             for i in range(rem_circuits):
-                count = min(per_c, gen_recepts - i * per_c)
-                if count <= 0:
-                    break
-                add(15, 1, f"General Receptacles #{i+1} (AFCI)",
-                    wire="14/2 NM-B", afci=True, count=count,
+                count = base + 1 if i < extra else base
+                add(15, 1, _GENERAL_RECEPTS[i],
+                    wire=_WIRE_14_2, afci=True, count=count,
                     watts=count * 180, room="Various")
 
     # ═══════════════════════════════════════════════
     # 15. SPARE CIRCUITS (good practice)
     # ═══════════════════════════════════════════════
 
-    add(15, 1, "Spare #1", wire="—", count=0, watts=0)
-    add(15, 1, "Spare #2", wire="—", count=0, watts=0)
+    for spare in _SPARES:
+        add(*spare)
 
     # ═══════════════════════════════════════════════
     # LOAD CALCULATION (CEC Rule 8-200)
     # ═══════════════════════════════════════════════
 
-    total_load = sum(c.load_watts for c in circuits)
-
-    # CEC demand calculation
-    # Basic load: first 5000W at 100%, remainder at 25%
-    basic_load = sum(
-        c.load_watts for c in circuits
-        if c.amperage <= 20 and c.poles == 1
-    )
-    demand_basic = min(basic_load, 5000) + max(0, basic_load - 5000) * 0.25
-
-    # Large appliances at 100%
-    large_load = sum(
-        c.load_watts for c in circuits
-        if c.poles == 2 or c.amperage >= 30
+    total_load, basic_load, large_load, spaces_used = _sum_loads(circuits)
+    total_demand, service_amps, panel_amps, spaces_total = _size_service(
+        basic_load, large_load, total_sqft > 1500 or has_ac or has_electric_heat
     )
 
-    total_demand = int(demand_basic + large_load)
-    service_amps = total_demand / 240.0
-
-    # Determine panel size
-    if service_amps <= 60:
-        panel_amps = 100
-    elif service_amps <= 100:
-        panel_amps = 100
-    elif service_amps <= 125:
-        panel_amps = 125
-    else:
-        panel_amps = 200
-
-    # Modern homes default to 200A
-    if total_sqft > 1500 or has_ac or has_electric_heat:
-        panel_amps = max(panel_amps, 200)
-
-    spaces_used = sum(c.poles for c in circuits)
-    spaces_total = 40 if panel_amps >= 200 else 30 if panel_amps >= 125 else 20
-
     # Multi-unit adjustment
     unit_count = {"single": 1, "duplex": 2, "triplex": 3, "fourplex": 4}.get(
         dwelling_type, 1
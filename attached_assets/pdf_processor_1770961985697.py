@@ -1,22 +1,30 @@
 """PDF to image conversion and text extraction for electrical drawing analysis."""
 
+import hashlib
 import io
+import multiprocessing
+import os
 import re
+import tempfile
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import repeat
 from pathlib import Path
-from typing import Optional
+from typing import Iterable, Iterator, Optional, Sequence
 
 import fitz  # PyMuPDF
-from PIL import Image
+from PIL import Image, ImageChops, ImageEnhance, ImageFilter, ImageStat
 
 
 # Room name patterns for matching table rows
-_ROOM_KEYWORDS = {
+_ROOM_KEYWORDS = frozenset({
     "garage", "bedroom", "bath", "bathroom", "kitchen", "living", "dining",
     "hallway", "hall", "entrance", "foyer", "laundry", "closet", "pantry",
     "office", "den", "family", "powder", "utility", "mechanical", "mudroom",
     "stairway", "stairs", "ensuite", "primary", "master", "wic", "w.i.c",
     "suite", "patio", "deck", "entry", "mech", "nook",
-}
+})
 
 # Standardized room type mapping from common PDF labels
 _ROOM_TYPE_MAP = {
@@ -80,16 +88,188 @@ _LEVEL_MAP = {
     "lower": "basement",
 }
 
+# Area/number patterns, compiled once
+_RE_AREA_CLEAN = re.compile(r"[^\d.]")
+_RE_SF = re.compile(r'(\d+\.?\d*)\s*(?:SF|sq\.?\s*ft\.?|sqft)', re.IGNORECASE)
+_RE_SF_STRIP = re.compile(r'\d+\.?\d*\s*(?:SF|sq\.?\s*ft\.?|sqft)\s*', re.IGNORECASE)
+_RE_NUM = re.compile(r'\b(\d+\.?\d*)\b')
+# Any room keyword as a substring — one scan instead of a test per keyword
+_ROOM_KW_RE = re.compile(
+    "|".join(sorted(map(re.escape, _ROOM_KEYWORDS), key=len, reverse=True))
+)
+# Section-header level words in table rows (substring match)
+_LEVEL_KW_RE = re.compile(
+    "basement|main|upper|ground|first|second|third|lower|1st|2nd|3rd"
+)
+# Bare column-header lines in text schedules
+_HEADER_WORDS = frozenset({"total", "name", "area", "schedule", "level"})
+# Table header cells: which column holds area / level / room name
+_AREA_HDR_RE = re.compile("area|sq ft|sqft|sf")
+_LEVEL_HDR_RE = re.compile("level|floor|storey|story")
+_NAME_HDR_RE = re.compile("name|space")
+# Any level keyword as a substring (section-header detection)
+_LEVEL_MAP_RE = re.compile("|".join(map(re.escape, _LEVEL_MAP)))
+# Any level keyword as a whole word, longest first so "ground floor" is
+# removed whole rather than leaving "floor" behind
+_RE_LEVEL_STRIP = re.compile(
+    r'\b(?:' + '|'.join(map(re.escape, sorted(_LEVEL_MAP, key=len, reverse=True)))
+    + r')\b',
+    re.IGNORECASE,
+)
+
+_SHARPEN = ImageFilter.SHARPEN
+_RAMP = Image.frombytes("L", (256, 1), bytes(range(256)))  # every 8-bit level
+
+# A path to a PDF, or a document the caller already has open
+PDFSource = str | Path | fitz.Document
+
+# Render colorspaces: "gray" renders 1 byte/pixel; "auto" renders RGB and
+# keeps a single gray channel when the page has no colour in it
+_COLORSPACES = {"rgb": fitz.csRGB, "gray": fitz.csGRAY, "auto": fitz.csRGB}
+# Pixmap component count (alpha included) -> PIL mode
+_PIXMAP_MODES = {1: "L", 2: "LA", 3: "RGB", 4: "RGBA"}
+
+# MuPDF holds the GIL while rendering, so pages are spread over processes.
+# Spawned (not forked) workers — MuPDF state isn't fork-safe.
+_SPAWN = multiprocessing.get_context("spawn")
+_DEFAULT_WORKERS = min(os.cpu_count() or 1, 4)
+
+
+@lru_cache(maxsize=1)
+def _worker_doc(pdf_path: str) -> fitz.Document:
+    # Each worker process opens the file once for all the pages it renders
+    return fitz.open(pdf_path)
+
+
+def _raw_pixels(pix: fitz.Pixmap) -> tuple[str, tuple[int, int], bytes]:
+    """Image.frombytes() arguments for a pixmap's raw samples."""
+    return _PIXMAP_MODES[pix.n], (pix.width, pix.height), pix.samples
+
+
+def _pixmap_to_image(pix: fitz.Pixmap) -> Image.Image:
+    # Wrap the raw samples directly — no PNG encode/decode round-trip
+    return Image.frombytes(*_raw_pixels(pix))
+
+
+def _colorspace(name: str) -> fitz.Colorspace:
+    try:
+        return _COLORSPACES[name]
+    except KeyError:
+        raise ValueError(f"Unknown colorspace: {name}") from None
+
+
+def _downgrade_gray(img: Image.Image) -> Image.Image:
+    """Return an RGB image as "L" if its three channels are identical."""
+    r, g, b = img.split()
+    if ImageChops.difference(r, g).getbbox() or ImageChops.difference(g, b).getbbox():
+        return img
+    return r
+
+
+def _norm_cell(cell) -> str:
+    """Table cell as stripped text ("" for empty/None cells)."""
+    return str(cell).strip() if cell else ""
+
+
+def _contrast_lut(mean: int, factor: float) -> list[int]:
+    """Per-level lookup table for ImageEnhance.Contrast around mean.
+
+    Runs Pillow's own blend over the 256 levels so the table matches its
+    per-pixel arithmetic exactly, rounding included.
+    """
+    return list(Image.blend(Image.new("L", (256, 1), mean), _RAMP, factor).tobytes())
+
+
+def _raw_bytes(img: Image.Image) -> bytes:
+    """Raw pixel bytes from a single encoder call.
+
+    Image.tobytes() encodes in MAXBLOCK chunks and joins them, holding the
+    image's size twice over; sizing the one output buffer up front avoids
+    that for the byte-per-band modes rendered pages use.
+    """
+    img.load()
+    if not img.width or not img.height:
+        return b""
+    encoder = Image._getencoder(img.mode, "raw", img.mode)
+    encoder.setimage(img.im, (0, 0) + img.size)
+    _, status, data = encoder.encode(img.width * img.height * len(img.getbands()))
+    if status <= 0:  # more than a byte per band ("I", "F", "I;16")
+        return img.tobytes()
+    return data
+
+
+def _load_cached(path: Path) -> Optional[Image.Image]:
+    """A previously rendered page from the disk cache, or None on a miss."""
+    try:
+        with Image.open(path) as img:
+            img.load()
+    except (OSError, ValueError):  # missing, or unreadable/partial file
+        return None
+    return img
+
+
+def _store_cached(path: Path, img: Image.Image) -> None:
+    """Write a rendered page to the disk cache atomically (best effort)."""
+    try:
+        fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                img.save(f, format="PNG")
+            os.replace(tmp, path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+    except OSError:
+        pass  # a full or read-only cache dir just means no caching
+
+
+def _render_page(
+    pdf_path: str, page_number: int, zoom: float, colorspace: str
+) -> tuple[str, tuple[int, int], bytes]:
+    """Render one page to raw pixels (process-pool worker)."""
+    page = _worker_doc(pdf_path)[page_number]
+    pix = page.get_pixmap(
+        matrix=fitz.Matrix(zoom, zoom), alpha=False,
+        colorspace=_COLORSPACES[colorspace],
+    )
+    return _raw_pixels(pix)
+
+
+def _extract_page_rooms(pdf_path: str, page_number: int) -> Optional[list[dict]]:
+    """Room table from one page (process-pool worker)."""
+    page = _worker_doc(pdf_path)[page_number]
+    return PDFProcessor()._page_rooms(page, page.get_text("text"))
+
 
 class PDFProcessor:
     """Converts PDF drawing pages to high-resolution images for AI analysis."""
 
     DEFAULT_DPI = 300
     MAX_DPI = 600
+    DOC_CACHE_SIZE = 4  # open documents kept per processor
+    PARALLEL_MIN_PAGES = 4  # below this, worker start-up outweighs rendering
 
-    def __init__(self, dpi: int = DEFAULT_DPI):
+    def __init__(self, dpi: int = DEFAULT_DPI, cache_dir: str | Path | None = None):
         self.dpi = min(dpi, self.MAX_DPI)
         self._zoom = self.dpi / 72  # PDF default is 72 DPI
+        # (path, mtime_ns, size) -> open document, least recently used first
+        self._docs: OrderedDict[tuple, fitz.Document] = OrderedDict()
+        # Optional on-disk cache of rendered pages (PNG), shared across runs
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None
+        if self.cache_dir is not None:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    def __enter__(self) -> "PDFProcessor":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close every cached document."""
+        for doc in self._docs.values():
+            doc.close()
+        self._docs.clear()
 
     def load_pdf(self, pdf_path: str | Path) -> fitz.Document:
         pdf_path = Path(pdf_path)
@@ -99,108 +279,328 @@ class PDFProcessor:
             raise ValueError(f"Not a PDF file: {pdf_path}")
         return fitz.open(str(pdf_path))
 
-    def get_page_count(self, pdf_path: str | Path) -> int:
-        doc = self.load_pdf(pdf_path)
-        count = len(doc)
-        doc.close()
-        return count
+    def _open_cached(self, pdf_path: PDFSource) -> fitz.Document:
+        """Open a PDF once per (path, mtime, size); pass documents through.
+
+        Cached documents stay open until evicted or close() is called, so
+        callers must not close what this returns.
+        """
+        if isinstance(pdf_path, fitz.Document):
+            return pdf_path
+        pdf_path = Path(pdf_path)
+        try:
+            st = pdf_path.stat()
+        except FileNotFoundError:
+            raise FileNotFoundError(f"PDF not found: {pdf_path}") from None
+        key = (str(pdf_path), st.st_mtime_ns, st.st_size)
+        docs = self._docs
+        doc = docs.get(key)
+        if doc is not None:
+            docs.move_to_end(key)
+            return doc
+        doc = docs[key] = self.load_pdf(pdf_path)
+        if len(docs) > self.DOC_CACHE_SIZE:
+            docs.popitem(last=False)[1].close()
+        return doc
+
+    def _cache_file(
+        self, doc: fitz.Document, page_number: int, colorspace: str
+    ) -> Optional[Path]:
+        """Disk-cache path for a rendered page, or None when not caching.
+
+        Keyed on the file's path, mtime and size plus DPI, page and
+        colorspace, so an edited PDF or changed settings never hit stale
+        renders.
+        """
+        if self.cache_dir is None or not doc.name:
+            return None
+        try:
+            st = os.stat(doc.name)
+        except OSError:
+            return None
+        key = (
+            f"{os.path.abspath(doc.name)}|{st.st_mtime_ns}|{st.st_size}|"
+            f"{self.dpi}|{page_number}|{colorspace}"
+        )
+        return self.cache_dir / f"{hashlib.sha1(key.encode()).hexdigest()[:16]}.png"
+
+    def get_page_count(self, pdf_path: PDFSource) -> int:
+        return self._open_cached(pdf_path).page_count
+
+    def _render_pages(
+        self,
+        doc: fitz.Document,
+        page_numbers: Sequence[int],
+        zooms: Iterable[float],
+        num_workers: Optional[int],
+        colorspace: str = "rgb",
+    ) -> Iterator[Image.Image]:
+        """Render pages to images, in a process pool when worthwhile.
+
+        zooms gives each page's scale, in page_numbers order (pass
+        itertools.repeat(z) for a uniform one).
+
+        Short page lists, a single worker, and documents with no file
+        behind them (workers reopen by path) render in-process, lazily —
+        one page at a time as the caller consumes them. The pool path
+        submits every page up front and yields results in page order.
+        """
+        cs = _colorspace(colorspace)
+        gray_check = colorspace == "auto"
+        workers = _DEFAULT_WORKERS if num_workers is None else num_workers
+        if workers <= 1 or len(page_numbers) < self.PARALLEL_MIN_PAGES or not doc.name:
+            for pn, zoom in zip(page_numbers, zooms):
+                img = _pixmap_to_image(doc[pn].get_pixmap(
+                    matrix=fitz.Matrix(zoom, zoom), alpha=False, colorspace=cs
+                ))
+                yield _downgrade_gray(img) if gray_check else img
+            return
+        with ProcessPoolExecutor(
+            max_workers=min(workers, len(page_numbers)), mp_context=_SPAWN
+        ) as pool:
+            for raw in pool.map(
+                _render_page, repeat(doc.name), page_numbers,
+                zooms, repeat(colorspace),
+            ):
+                img = Image.frombytes(*raw)
+                yield _downgrade_gray(img) if gray_check else img
 
     def get_page_thumbnails(
-        self, pdf_path: str | Path, thumb_width: int = 300
+        self,
+        pdf_path: PDFSource,
+        thumb_width: int = 300,
+        num_workers: Optional[int] = 1,
     ) -> list[Image.Image]:
-        """Generate small thumbnails for page selection UI."""
-        doc = self.load_pdf(pdf_path)
-        thumbnails = []
-        for page in doc:
-            # Low-res render for thumbnails
-            mat = fitz.Matrix(0.5, 0.5)
-            pix = page.get_pixmap(matrix=mat)
-            img = Image.open(io.BytesIO(pix.tobytes("png")))
-            img.thumbnail((thumb_width, thumb_width), Image.LANCZOS)
-            thumbnails.append(img)
-        doc.close()
-        return thumbnails
+        """Generate small thumbnails for page selection UI.
+
+        Rendered in-process by default: at half scale or less a page takes
+        milliseconds, far less than starting worker processes.
+        """
+        doc = self._open_cached(pdf_path)
+        # Render each page straight at thumbnail size: fit within a
+        # thumb_width square, never above half scale
+        zooms = [
+            min(0.5, thumb_width / page.rect.width, thumb_width / page.rect.height)
+            for page in doc
+        ]
+        return list(self._render_pages(doc, range(doc.page_count), zooms, num_workers))
+
+    def _render_pixmap(
+        self, pdf_path: PDFSource, page_number: int, colorspace: str
+    ) -> fitz.Pixmap:
+        doc = self._open_cached(pdf_path)
+        n = doc.page_count
+        if page_number < 0 or page_number >= n:
+            raise IndexError(f"Page {page_number} out of range (0-{n - 1})")
+        mat = fitz.Matrix(self._zoom, self._zoom)
+        return doc[page_number].get_pixmap(
+            matrix=mat, alpha=False, colorspace=_colorspace(colorspace)
+        )
 
     def page_to_image(
-        self, pdf_path: str | Path, page_number: int
+        self, pdf_path: PDFSource, page_number: int, colorspace: str = "rgb"
     ) -> Image.Image:
-        """Convert a single PDF page to a high-resolution PIL Image."""
-        doc = self.load_pdf(pdf_path)
-        if page_number < 0 or page_number >= len(doc):
-            doc.close()
-            raise IndexError(
-                f"Page {page_number} out of range (0-{len(doc) - 1})"
-            )
-        page = doc[page_number]
-        mat = fitz.Matrix(self._zoom, self._zoom)
-        pix = page.get_pixmap(matrix=mat, alpha=False)
-        img = Image.open(io.BytesIO(pix.tobytes("png")))
-        doc.close()
+        """Convert a single PDF page to a high-resolution PIL Image.
+
+        colorspace: "rgb", "gray" (an "L" image, a third of the size), or
+        "auto" (RGB, returned as "L" when the page has no colour).
+        """
+        doc = self._open_cached(pdf_path)
+        cache_file = self._cache_file(doc, page_number, colorspace)
+        if cache_file is not None:
+            img = _load_cached(cache_file)
+            if img is not None:
+                return img
+        img = _pixmap_to_image(self._render_pixmap(doc, page_number, colorspace))
+        if colorspace == "auto":
+            img = _downgrade_gray(img)
+        if cache_file is not None:
+            _store_cached(cache_file, img)
         return img
 
+    def page_to_raw_bytes(
+        self, pdf_path: PDFSource, page_number: int, colorspace: str = "rgb"
+    ) -> tuple[bytes, int, int, str]:
+        """Render a page straight to raw pixels, without building an image.
+
+        Returns (samples, width, height, mode) — the pixmap's own buffer,
+        for endpoints that accept raw RGB/L data. Use page_to_image when an
+        encoded format (PNG/JPEG) is needed.
+        """
+        if colorspace == "auto":
+            # Needs the rendered image to test for colour
+            img = self.page_to_image(pdf_path, page_number, colorspace)
+            return _raw_bytes(img), img.width, img.height, img.mode
+        mode, (width, height), samples = _raw_pixels(
+            self._render_pixmap(pdf_path, page_number, colorspace)
+        )
+        return samples, width, height, mode
+
     def pages_to_images(
         self,
-        pdf_path: str | Path,
+        pdf_path: PDFSource,
         page_numbers: Optional[list[int]] = None,
+        num_workers: Optional[int] = None,
+        colorspace: str = "rgb",
     ) -> dict[int, Image.Image]:
-        """Convert multiple PDF pages to images. If page_numbers is None, convert all."""
-        doc = self.load_pdf(pdf_path)
-        if page_numbers is None:
-            page_numbers = list(range(len(doc)))
+        """Convert multiple PDF pages to images. If page_numbers is None, convert all.
 
-        images = {}
-        mat = fitz.Matrix(self._zoom, self._zoom)
+        Multi-page requests render across up to num_workers processes
+        (default: min(CPU count, 4)); pass 1 to render in-process.
+        colorspace is as for page_to_image.
+        """
+        return dict(self.iter_pages_to_images(
+            pdf_path, page_numbers, num_workers, colorspace
+        ))
+
+    def iter_pages_to_images(
+        self,
+        pdf_path: PDFSource,
+        page_numbers: Optional[list[int]] = None,
+        num_workers: Optional[int] = 1,
+        colorspace: str = "rgb",
+    ) -> Iterator[tuple[int, Image.Image]]:
+        """Yield (page_number, image) pairs, rendering as they're consumed.
+
+        With the default single worker only one page image is alive at a
+        time (if the caller drops each before the next), instead of the
+        whole document's worth. Arguments are as for pages_to_images.
+        """
+        doc = self._open_cached(pdf_path)
+        n = doc.page_count
+        if page_numbers is None:
+            page_numbers = range(n)
+        else:
+            # Out-of-range pages are skipped; repeats render once
+            page_numbers = [pn for pn in dict.fromkeys(page_numbers) if 0 <= pn < n]
+        if self.cache_dir is None:
+            images = self._render_pages(
+                doc, page_numbers, repeat(self._zoom), num_workers, colorspace
+            )
+            yield from zip(page_numbers, images)
+            return
+
+        # Serve cached pages from disk; render only the misses (still in
+        # page order, so they can be drawn from one lazy render stream)
+        cache_files = {pn: self._cache_file(doc, pn, colorspace) for pn in page_numbers}
+        cached = {}
+        misses = []
+        for pn, cache_file in cache_files.items():
+            if cache_file is not None and cache_file.exists():
+                cached[pn] = cache_file
+            else:
+                misses.append(pn)
+        rendered = self._render_pages(
+            doc, misses, repeat(self._zoom), num_workers, colorspace
+        )
         for pn in page_numbers:
-            if 0 <= pn < len(doc):
-                pix = doc[pn].get_pixmap(matrix=mat, alpha=False)
-                images[pn] = Image.open(io.BytesIO(pix.tobytes("png")))
-        doc.close()
-        return images
-
-    def image_to_bytes(self, img: Image.Image, format: str = "PNG") -> bytes:
-        """Convert a PIL Image to bytes for API submission."""
-        buf = io.BytesIO()
-        img.save(buf, format=format)
-        return buf.getvalue()
+            if pn in cached:
+                img = _load_cached(cached[pn])
+                if img is None:  # removed or corrupt since the check
+                    img = self.page_to_image(doc, pn, colorspace)
+            else:
+                img = next(rendered)
+                if cache_files[pn] is not None:
+                    _store_cached(cache_files[pn], img)
+            yield pn, img
+
+    def image_to_bytes(
+        self, img: Image.Image, format: str = "PNG", **params
+    ) -> bytes:
+        """Convert a PIL Image to bytes for API submission.
+
+        format="RAW" returns the bare pixel buffer (for endpoints that take
+        raw RGB); anything else is passed to Image.save with params, e.g.
+        optimize=True (off by default — it buffers the whole encode).
+        """
+        if format.upper() == "RAW":
+            return _raw_bytes(img)
+        with io.BytesIO() as buf:
+            img.save(buf, format=format, **params)
+            return buf.getvalue()
 
     def enhance_for_analysis(self, img: Image.Image) -> Image.Image:
         """Pre-process image for better AI symbol detection."""
-        from PIL import ImageEnhance, ImageFilter
-
-        # Increase contrast for clearer symbol edges
-        enhancer = ImageEnhance.Contrast(img)
-        img = enhancer.enhance(1.3)
+        # Increase contrast for clearer symbol edges. For rendered pages
+        # (L/RGB) that's a single table lookup — same result as
+        # ImageEnhance.Contrast without its full-size gray image and blend.
+        if img.mode in ("L", "RGB"):
+            gray = img if img.mode == "L" else img.convert("L")
+            mean = int(ImageStat.Stat(gray).mean[0] + 0.5)
+            img = img.point(_contrast_lut(mean, 1.3) * len(img.getbands()))
+        else:
+            img = ImageEnhance.Contrast(img).enhance(1.3)
         # Slight sharpening
-        img = img.filter(ImageFilter.SHARPEN)
-        return img
+        return img.filter(_SHARPEN)
 
     def extract_room_table(
-        self, pdf_path: str | Path
+        self, pdf_path: PDFSource, num_workers: Optional[int] = None
     ) -> Optional[list[dict]]:
         """Try to extract a room schedule/count table from the PDF.
 
         Looks for structured tables with room names, areas, and floor levels.
         Returns a list of dicts: [{"name": str, "area_sqft": float, "level": str}]
         or None if no room table is found.
+
+        The first page (in order) holding a table wins. When several pages
+        need the full search they're spread over up to num_workers
+        processes, as in pages_to_images.
         """
-        doc = self.load_pdf(pdf_path)
-        rooms = None
+        doc = self._open_cached(pdf_path)
+        workers = _DEFAULT_WORKERS if num_workers is None else num_workers
+        if workers <= 1 or doc.page_count < self.PARALLEL_MIN_PAGES or not doc.name:
+            for page in doc:
+                rooms = self._page_rooms(page, page.get_text("text"))
+                if rooms:
+                    return rooms
+            return None
 
-        for page_num in range(len(doc)):
-            page = doc[page_num]
+        # Cheap text screen in-process; only pages that pass are searched
+        candidates = []
+        for page in doc:
+            text = page.get_text("text")
+            if _ROOM_KW_RE.search(text.lower()):
+                candidates.append((page, text))
+        if len(candidates) < self.PARALLEL_MIN_PAGES:
+            for page, text in candidates:
+                rooms = self._page_rooms(page, text)
+                if rooms:
+                    return rooms
+            return None
 
-            # Method 1: Try PyMuPDF's find_tables() (v1.23+)
-            rooms = self._try_find_tables(page)
-            if rooms:
-                break
+        pool = ProcessPoolExecutor(
+            max_workers=min(workers, len(candidates)), mp_context=_SPAWN
+        )
+        try:
+            # map() yields in page order, so the first hit is the first page
+            for rooms in pool.map(
+                _extract_page_rooms, repeat(doc.name),
+                [page.number for page, _ in candidates],
+            ):
+                if rooms:
+                    return rooms
+            return None
+        finally:
+            pool.shutdown(cancel_futures=True)
 
-            # Method 2: Fall back to text-based parsing
-            rooms = self._try_text_parsing(page)
+    def _page_rooms(self, page, text: str) -> Optional[list[dict]]:
+        """Room table from one page, given its extracted text."""
+        # Both methods need a room keyword on the page, so drawing sheets
+        # are rejected before table detection
+        text_lower = text.lower()
+        if not _ROOM_KW_RE.search(text_lower):
+            return None
+
+        # Method 1: Try PyMuPDF's find_tables() (v1.23+) — only tables
+        # with area and name header cells qualify, so floor plans that
+        # merely label rooms skip the detection
+        if _AREA_HDR_RE.search(text_lower) and _NAME_HDR_RE.search(text_lower):
+            rooms = self._try_find_tables(page)
             if rooms:
-                break
+                return rooms
 
-        doc.close()
-        return rooms
+        # Method 2: Fall back to text-based parsing
+        return self._try_text_parsing(page, text)
 
     def _try_find_tables(self, page) -> Optional[list[dict]]:
         """Use PyMuPDF's built-in table detection if available."""
@@ -221,17 +621,14 @@ class PDFProcessor:
             level_col = None
 
             for try_row in range(min(5, len(data))):
-                row_cells = [
-                    str(cell).strip().lower() if cell else ""
-                    for cell in data[try_row]
-                ]
                 nc = ac = lc = None
-                for i, h in enumerate(row_cells):
-                    if any(kw in h for kw in ("area", "sq ft", "sqft", "sf")):
+                for i, cell in enumerate(map(_norm_cell, data[try_row])):
+                    h = cell.lower()
+                    if _AREA_HDR_RE.search(h):
                         ac = i
-                    elif any(kw in h for kw in ("level", "floor", "storey", "story")):
+                    elif _LEVEL_HDR_RE.search(h):
                         lc = i
-                    elif any(kw in h for kw in ("name", "space")):
+                    elif _NAME_HDR_RE.search(h):
                         nc = i
                 # Need at minimum area + name columns to confirm header
                 if ac is not None and nc is not None:
@@ -244,38 +641,37 @@ class PDFProcessor:
 
             rooms = []
             current_section_level = ""
+            parse_area = self._parse_area
+            find_level_kw = _LEVEL_KW_RE.search
+            find_room_kw = _ROOM_KW_RE.search
 
             for row in data[header_idx + 1:]:
-                cells = [str(cell).strip() if cell else "" for cell in row]
+                cells = list(map(_norm_cell, row))
+                n_cells = len(cells)
 
-                name = cells[name_col] if name_col < len(cells) else ""
-                area_str = cells[area_col] if area_col < len(cells) else ""
+                name = cells[name_col] if name_col < n_cells else ""
+                area_str = cells[area_col] if area_col < n_cells else ""
 
-                # Skip empty rows and totals
-                name_lower = name.lower().strip()
-                if not name and not area_str:
+                # Skip empty rows, and pure total rows (area with no name)
+                if not name:
                     continue
-                if any(kw in name_lower for kw in ("total", "grand total")):
-                    continue
-                # Skip pure total rows (area with no name or vice versa)
-                if not name and area_str:
+                # Skip totals (incl. "grand total")
+                name_lower = name.lower()
+                if "total" in name_lower:
                     continue
 
                 # Detect section headers: row with name but no valid area,
                 # or name matches a level keyword (e.g., "BASEMENT", "MAIN FLOOR")
-                area_val = self._parse_area(area_str)
-                is_level = any(
-                    lk in name_lower
-                    for lk in ("basement", "main", "upper", "ground", "first",
-                               "second", "third", "lower", "1st", "2nd", "3rd")
-                )
-                non_empty = sum(1 for c in cells if c.strip())
-                if is_level and (non_empty <= 2 or area_val == 0):
+                area_val = parse_area(area_str)
+                if find_level_kw(name_lower) and (
+                    area_val == 0 or n_cells - cells.count("") <= 2
+                ):
                     current_section_level = name
                     continue
 
-                # Skip rows where name doesn't look like a room
-                if not any(kw in name_lower for kw in _ROOM_KEYWORDS):
+                # Skip rows where name doesn't look like a room (exact
+                # keyword first — the common "Kitchen" / "Garage" cell)
+                if name_lower not in _ROOM_KEYWORDS and not find_room_kw(name_lower):
                     continue
 
                 # Sanity check: residential rooms rarely exceed 2500 sqft
@@ -283,8 +679,8 @@ class PDFProcessor:
                     continue
 
                 level = ""
-                if level_col is not None and level_col < len(cells):
-                    level = cells[level_col].strip()
+                if level_col is not None and level_col < n_cells:
+                    level = cells[level_col]
                 if not level and current_section_level:
                     level = current_section_level
 
@@ -299,9 +695,13 @@ class PDFProcessor:
 
         return None
 
-    def _try_text_parsing(self, page) -> Optional[list[dict]]:
-        """Parse room table from raw text extraction."""
-        text = page.get_text("text")
+    def _try_text_parsing(
+        self, page, text: Optional[str] = None
+    ) -> Optional[list[dict]]:
+        """Parse room table from raw text extraction (text: the page's
+        already-extracted text, if the caller has it)."""
+        if text is None:
+            text = page.get_text("text")
         if not text:
             return None
 
@@ -317,85 +717,81 @@ class PDFProcessor:
         if not (has_schedule or has_room_names):
             return None
 
+        # Walk original and lowercased lines together (lowercased once
+        # for the whole page)
         lines = text.strip().split("\n")
+        lower_lines = text_lower.strip().split("\n")
         rooms = []
         current_level = ""
+        find_room_kw = _ROOM_KW_RE.search
+        find_level = _LEVEL_MAP_RE.search
 
-        for line in lines:
+        for line, line_lower in zip(lines, lower_lines):
             line = line.strip()
             if not line:
                 continue
 
-            line_lower = line.lower()
+            line_lower = line_lower.strip()
+            has_room_kw = find_room_kw(line_lower) is not None
 
-            # Detect floor/level section headers
-            is_level_header = False
-            for level_name in _LEVEL_MAP:
-                if level_name in line_lower and len(line) < 40:
-                    # Only set as level if this line isn't also a data row
-                    if not any(kw in line_lower for kw in _ROOM_KEYWORDS if kw != level_name):
-                        current_level = line
-                        is_level_header = True
-                    break
-            if is_level_header:
+            # Detect floor/level section headers — only set as level if
+            # this line isn't also a data row (no level name is itself a
+            # room keyword)
+            if not has_room_kw and len(line) < 40 and find_level(line_lower):
+                current_level = line
                 continue
 
             # Skip headers and totals
-            if any(kw == line_lower.strip() for kw in ("total", "name", "area", "schedule", "level")):
+            if line_lower in _HEADER_WORDS:
                 continue
-            if "total" in line_lower and any(c.isdigit() for c in line):
+            if "total" in line_lower and any(map(str.isdigit, line)):
                 continue
 
             # Try to parse as room row
             # Pattern: "NNN SF LEVEL ROOM_NAME" or "ROOM_NAME NNN"
-            for kw in _ROOM_KEYWORDS:
-                if kw in line_lower:
-                    area = self._extract_area_from_line(line)
-                    if 5 <= area <= 2500:
-                        # Extract room name: remove area number and unit
-                        name = re.sub(
-                            r'\d+\.?\d*\s*(?:SF|sq\.?\s*ft\.?|sqft)\s*',
-                            '', line, flags=re.IGNORECASE,
-                        ).strip()
-                        # Remove level keywords from name
-                        for lk in _LEVEL_MAP:
-                            name = re.sub(
-                                r'\b' + re.escape(lk) + r'\b', '',
-                                name, flags=re.IGNORECASE,
-                            ).strip()
-                        name = name.strip(" \t-,|")
-                        if name:
-                            rooms.append({
-                                "name": name,
-                                "area_sqft": area,
-                                "level": current_level,
-                            })
-                    break
+            if has_room_kw:
+                area = self._extract_area_from_line(line)
+                if 5 <= area <= 2500:
+                    # Extract room name: remove area number and unit
+                    name = _RE_SF_STRIP.sub('', line)
+                    # Remove level keywords from name
+                    name = _RE_LEVEL_STRIP.sub('', name)
+                    name = name.strip(" \t-,|")
+                    if name:
+                        rooms.append({
+                            "name": name,
+                            "area_sqft": area,
+                            "level": current_level,
+                        })
 
         return rooms if len(rooms) >= 2 else None
 
+    # Area cells/lines repeat heavily across schedule pages ("120", "12 SF"),
+    # so both parsers are memoized
     @staticmethod
+    @lru_cache(maxsize=2048)
     def _parse_area(area_str: str) -> float:
         """Parse area value from string, handling various formats."""
         # Remove non-numeric chars except decimal point
-        cleaned = re.sub(r"[^\d.]", "", area_str)
+        cleaned = _RE_AREA_CLEAN.sub("", area_str)
         try:
             return float(cleaned)
         except ValueError:
             return 0.0
 
     @staticmethod
+    @lru_cache(maxsize=2048)
     def _extract_area_from_line(line: str) -> float:
         """Extract numeric area value from a text line."""
         # Prefer "NNN SF" pattern first
-        sf_match = re.search(r'(\d+\.?\d*)\s*(?:SF|sq\.?\s*ft\.?|sqft)', line, re.IGNORECASE)
+        sf_match = _RE_SF.search(line)
         if sf_match:
             val = float(sf_match.group(1))
             if 5 <= val <= 2500:
                 return val
 
         # Fallback: find standalone numbers in reasonable range
-        numbers = re.findall(r'\b(\d+\.?\d*)\b', line)
+        numbers = _RE_NUM.findall(line)
         for num_str in numbers:
             val = float(num_str)
             if 10 <= val <= 2500:
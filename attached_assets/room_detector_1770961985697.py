@@ -7,15 +7,33 @@ When a residential PDF has no electrical drawings, this module:
 4. Generates symbol counts compatible with the existing estimator
 """
 
+import base64
+import hashlib
 import json
 import io
-from dataclasses import dataclass, field
+import os
+import tempfile
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, replace
+from functools import lru_cache
+from pathlib import Path
 from typing import Optional
 
 from PIL import Image
 
+try:
+    from google.genai import types as genai_types
+except ImportError:  # only needed once a Gemini request is made
+    genai_types = None
 
-@dataclass
+try:  # optional: orjson parses Gemini replies several times faster
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
+
+@dataclass(slots=True)
 class DetectedRoom:
     """A room identified on an architectural floor plan."""
     room_type: str          # standardized key (e.g. "kitchen", "bedroom")
@@ -26,7 +44,7 @@ class DetectedRoom:
     has_bathtub_shower: bool = False
     wall_count: int = 4     # usable walls for receptacle spacing
     confidence: float = 0.0
-    location: list[float] = field(default_factory=list)  # [x%, y%]
+    location: tuple[float, ...] = ()  # (x%, y%)
 
 
 @dataclass
@@ -43,82 +61,57 @@ class FloorPlanAnalysis:
 
 ROOM_DETECTION_PROMPT = """You are an expert residential architect analyzing an architectural floor plan drawing.
 
-TASK: Identify EVERY room on this floor plan. For each room, determine:
-1. Room type (use standardized names below)
-2. Room name as labelled on the drawing
-3. Approximate area in square feet (estimate from the drawing scale or proportions)
-4. Whether the room has a sink (kitchen, bathroom, laundry, etc.)
-5. Whether the room has a bathtub or shower
-6. Number of usable walls (walls with enough space for receptacles — exclude walls with large openings, floor-to-ceiling windows, fireplaces)
-7. Floor level (main, upper, lower, basement)
-8. Confidence score (0.0 to 1.0)
-9. Approximate x,y center location as percentages (0-100)
-
-STANDARDIZED ROOM TYPES (use these exactly):
-- kitchen
-- bathroom (full bath with tub/shower + sink + toilet)
-- powder_room (half bath — sink + toilet, no tub/shower)
-- primary_bedroom
-- bedroom
-- living_room
-- family_room
-- dining_room
-- hallway
-- garage (attached)
-- laundry_room
-- basement_finished
-- basement_unfinished
-- closet_walkin
-- closet_standard
-- entry_foyer
-- utility_room (mechanical/furnace/water heater)
-- office_den
-- mudroom
-- pantry
-- stairway
-- open_to_below (double-height space, not a real room)
-
-RESPOND WITH VALID JSON ONLY (no markdown, no explanation):
-{
-  "floor_level": "main",
-  "total_sqft": 1800,
-  "rooms": [
-    {
-      "room_type": "kitchen",
-      "room_name": "Kitchen",
-      "approx_area_sqft": 180,
-      "has_sink": true,
-      "has_bathtub_shower": false,
-      "wall_count": 3,
-      "confidence": 0.90,
-      "location": [45.0, 35.0]
+Identify EVERY room, including hallways, closets and stairways; list open-concept areas separately where the drawing shows distinct spaces. Per room give the room type, its label on the drawing as room_name, approximate area in sq ft (from dimensions or scale, else proportionally), a confidence (0.0-1.0) and the x,y center as image percentages (0-100). Set the page's floor_level (main, upper, lower, basement) and total_sqft.
+wall_count = walls usable for receptacles (exclude large openings, floor-to-ceiling windows, fireplaces). has_sink: kitchens, bathrooms, powder and laundry rooms, or visible plumbing. has_bathtub_shower: full bathrooms only.
+powder_room = half bath; utility_room = mechanical/furnace/water heater; open_to_below = double-height space, not a real room.
+"""
+
+# Standardized room types — also the enum in ROOM_DETECTION_SCHEMA
+ROOM_TYPES = (
+    "kitchen", "bathroom", "powder_room", "primary_bedroom", "bedroom",
+    "living_room", "family_room", "dining_room", "hallway", "garage",
+    "laundry_room", "basement_finished", "basement_unfinished",
+    "closet_walkin", "closet_standard", "entry_foyer", "utility_room",
+    "office_den", "mudroom", "pantry", "stairway", "open_to_below",
+)
+
+# Structured-output schema: Gemini returns exactly this JSON shape, so the
+# prompt needs no JSON example or room-type list
+ROOM_DETECTION_SCHEMA = {
+    "type": "OBJECT",
+    "properties": {
+        "floor_level": {"type": "STRING"},
+        "total_sqft": {"type": "NUMBER"},
+        "rooms": {
+            "type": "ARRAY",
+            "items": {
+                "type": "OBJECT",
+                "properties": {
+                    "room_type": {"type": "STRING", "enum": list(ROOM_TYPES)},
+                    "room_name": {"type": "STRING"},
+                    "approx_area_sqft": {"type": "NUMBER"},
+                    "has_sink": {"type": "BOOLEAN"},
+                    "has_bathtub_shower": {"type": "BOOLEAN"},
+                    "wall_count": {"type": "INTEGER"},
+                    "confidence": {"type": "NUMBER"},
+                    "location": {"type": "ARRAY", "items": {"type": "NUMBER"}},
+                },
+                "required": ["room_type", "room_name", "approx_area_sqft"],
+            },
+        },
     },
-    {
-      "room_type": "bathroom",
-      "room_name": "Main Bathroom",
-      "approx_area_sqft": 60,
-      "has_sink": true,
-      "has_bathtub_shower": true,
-      "wall_count": 4,
-      "confidence": 0.85,
-      "location": [70.0, 20.0]
-    }
-  ]
+    "required": ["floor_level", "rooms"],
 }
 
-IMPORTANT:
-- Count ALL rooms including hallways, closets, and stairways.
-- If a room label is visible on the drawing, use it for room_name.
-- Estimate areas proportionally if no dimensions are shown.
-- Mark has_sink=true for kitchens, bathrooms, powder rooms, laundry rooms, and any room with visible plumbing symbols.
-- Mark has_bathtub_shower=true only for full bathrooms.
-- For open-concept spaces (e.g., kitchen + living), list them as separate rooms if the drawing shows distinct areas.
-"""
+# Part of the response cache key — a prompt or schema edit invalidates cached pages
+PROMPT_HASH = hashlib.sha256(
+    (ROOM_DETECTION_PROMPT + json.dumps(ROOM_DETECTION_SCHEMA, sort_keys=True)).encode("utf-8")
+).hexdigest()
 
 
 # ─── CEC 2021 Minimum Device Requirements Per Room Type ───
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class CECRoomRequirement:
     """Minimum electrical devices for a room type per CEC 2021."""
     room_type: str
@@ -127,7 +120,7 @@ class CECRoomRequirement:
     receptacle_type: str  # "duplex", "gfci", "split_20a", etc.
     uses_wall_spacing_rule: bool  # True = 1.8m rule applies
     wall_spacing_m: float  # max distance from receptacle (1.8m or 4.5m for halls)
-    additional_receptacles: list[dict] = field(default_factory=list)
+    additional_receptacles: tuple[dict, ...] = ()
     # Lighting
     min_lighting_outlets: int = 1
     # Switches
@@ -138,8 +131,8 @@ class CECRoomRequirement:
     needs_exhaust_fan: bool = False
     needs_smoke_detector: bool = False
     needs_co_detector: bool = False
-    dedicated_circuits: list[str] = field(default_factory=list)
-    cec_rules: list[str] = field(default_factory=list)
+    dedicated_circuits: tuple[str, ...] = ()
+    cec_rules: tuple[str, ...] = ()
     notes: str = ""
 
 
@@ -151,17 +144,17 @@ CEC_ROOM_REQUIREMENTS: dict[str, CECRoomRequirement] = {
         receptacle_type="split_20a",
         uses_wall_spacing_rule=True,
         wall_spacing_m=0.9,  # 900mm for counter surfaces
-        additional_receptacles=[
+        additional_receptacles=(
             {"type": "dedicated_receptacle", "count": 1, "note": "Refrigerator (dedicated circuit)"},
             {"type": "duplex_receptacle", "count": 2, "note": "General wall receptacles (1.8m rule)"},
-        ],
+        ),
         min_lighting_outlets=1,
         min_switches=1,
         needs_gfci=True,
         needs_afci=False,  # kitchen counter receptacles exempt from AFCI
         needs_exhaust_fan=False,  # range hood is separate
-        dedicated_circuits=["Fridge (26-654 a)", "2x counter circuits (26-656 d)"],
-        cec_rules=["26-722 d)", "26-654 a)", "26-656 d)", "26-704 1)"],
+        dedicated_circuits=("Fridge (26-654 a)", "2x counter circuits (26-656 d)"),
+        cec_rules=("26-722 d)", "26-654 a)", "26-656 d)", "26-704 1)"),
         notes="Counter receptacles: no point >900mm from receptacle. Min 2 branch circuits for counter.",
     ),
     "bathroom": CECRoomRequirement(
@@ -175,7 +168,7 @@ CEC_ROOM_REQUIREMENTS: dict[str, CECRoomRequirement] = {
         needs_gfci=True,
         needs_afci=True,
         needs_exhaust_fan=True,
-        cec_rules=["26-720 f)", "26-720 g)", "26-704 1)", "30-320"],
+        cec_rules=("26-720 f)", "26-720 g)", "26-704 1)", "30-320"),
         notes="Receptacle within 1m of basin. Min 500mm from tub/shower. Wall switch for luminaire.",
     ),
     "powder_room": CECRoomRequirement(
@@ -188,7 +181,7 @@ CEC_ROOM_REQUIREMENTS: dict[str, CECRoomRequirement] = {
         min_switches=1,
         needs_gfci=True,
         needs_afci=True,
-        cec_rules=["26-720 f)", "26-704 1)", "30-320"],
+        cec_rules=("26-720 f)", "26-704 1)", "30-320"),
         notes="Receptacle within 1m of wash basin.",
     ),
     "primary_bedroom": CECRoomRequirement(
@@ -202,7 +195,7 @@ CEC_ROOM_REQUIREMENTS: dict[str, CECRoomRequirement] = {
         needs_gfci=False,
         needs_afci=True,
         needs_smoke_detector=True,
-        cec_rules=["26-722 a)", "26-658 1)", "32-200"],
+        cec_rules=("26-722 a)", "26-658 1)", "32-200"),
         notes="Smoke alarm required in sleeping rooms. AFCI required.",
     ),
     "bedroom": CECRoomRequirement(
@@ -216,7 +209,7 @@ CEC_ROOM_REQUIREMENTS: dict[str, CECRoomRequirement] = {
         needs_gfci=False,
         needs_afci=True,
         needs_smoke_detector=True,
-        cec_rules=["26-722 a)", "26-658 1)", "32-200"],
+        cec_rules=("26-722 a)", "26-658 1)", "32-200"),
         notes="Smoke alarm required in sleeping rooms. AFCI required.",
     ),
     "living_room": CECRoomRequirement(
@@ -230,7 +223,7 @@ CEC_ROOM_REQUIREMENTS: dict[str, CECRoomRequirement] = {
         needs_gfci=False,
         needs_afci=True,
         needs_smoke_detector=True,
-        cec_rules=["26-722 a)", "26-658 1)", "32-200"],
+        cec_rules=("26-722 a)", "26-658 1)", "32-200"),
         notes="1.8m wall spacing rule applies.",
     ),
     "family_room": CECRoomRequirement(
@@ -244,7 +237,7 @@ CEC_ROOM_REQUIREMENTS: dict[str, CECRoomRequirement] = {
         needs_gfci=False,
         needs_afci=True,
         needs_smoke_detector=True,
-        cec_rules=["26-722 a)", "26-658 1)"],
+        cec_rules=("26-722 a)", "26-658 1)"),
         notes="1.8m wall spacing rule applies.",
     ),
     "dining_room": CECRoomRequirement(
@@ -257,7 +250,7 @@ CEC_ROOM_REQUIREMENTS: dict[str, CECRoomRequirement] = {
         min_switches=1,
         needs_gfci=False,
         needs_afci=True,
-        cec_rules=["26-722 a)", "26-658 1)"],
+        cec_rules=("26-722 a)", "26-658 1)"),
         notes="1.8m wall spacing rule. No face-up receptacles in surfaces.",
     ),
     "hallway": CECRoomRequirement(
@@ -270,7 +263,7 @@ CEC_ROOM_REQUIREMENTS: dict[str, CECRoomRequirement] = {
         min_switches=2,  # typically 3-way at each end
         needs_gfci=False,
         needs_afci=True,
-        cec_rules=["26-722 e)", "26-658 1)"],
+        cec_rules=("26-722 e)", "26-658 1)"),
         notes="No point >4.5m from receptacle (measured by shortest cord path).",
     ),
     "garage": CECRoomRequirement(
@@ -279,15 +272,15 @@ CEC_ROOM_REQUIREMENTS: dict[str, CECRoomRequirement] = {
         receptacle_type="duplex",
         uses_wall_spacing_rule=False,
         wall_spacing_m=0,
-        additional_receptacles=[
+        additional_receptacles=(
             {"type": "duplex_receptacle", "count": 1, "note": "Garage door opener"},
-        ],
+        ),
         min_lighting_outlets=1,
         min_switches=2,  # 3-way: house entry and garage door
         needs_gfci=True,
         needs_afci=True,
-        dedicated_circuits=["Garage receptacles (26-656 h)"],
-        cec_rules=["26-724 b)", "26-724 c)", "26-656 h)"],
+        dedicated_circuits=("Garage receptacles (26-656 h)",),
+        cec_rules=("26-724 b)", "26-724 c)", "26-656 h)"),
         notes="3-way from house entry. 1 receptacle per car space. Dedicated circuit.",
     ),
     "laundry_room": CECRoomRequirement(
@@ -296,15 +289,15 @@ CEC_ROOM_REQUIREMENTS: dict[str, CECRoomRequirement] = {
         receptacle_type="duplex",
         uses_wall_spacing_rule=False,  # excluded from 1.8m rule
         wall_spacing_m=0,
-        additional_receptacles=[
+        additional_receptacles=(
             {"type": "dryer_outlet", "count": 1, "note": "Dryer (NEMA 14-30, dedicated)"},
-        ],
+        ),
         min_lighting_outlets=1,
         min_switches=1,
         needs_gfci=True,  # if sink present
         needs_afci=True,
-        dedicated_circuits=["Washer (26-654 b)", "Dryer (26-744 2)"],
-        cec_rules=["26-720 e)", "26-654 b)", "26-744 2)", "26-704 1)"],
+        dedicated_circuits=("Washer (26-654 b)", "Dryer (26-744 2)"),
+        cec_rules=("26-720 e)", "26-654 b)", "26-744 2)", "26-704 1)"),
         notes="1 receptacle for washer (dedicated), 1 additional. Dryer on dedicated circuit.",
     ),
     "basement_finished": CECRoomRequirement(
@@ -318,7 +311,7 @@ CEC_ROOM_REQUIREMENTS: dict[str, CECRoomRequirement] = {
         needs_gfci=False,
         needs_afci=True,
         needs_smoke_detector=True,
-        cec_rules=["26-722 a)", "26-658 1)", "32-200"],
+        cec_rules=("26-722 a)", "26-658 1)", "32-200"),
         notes="Treated as finished room. 1.8m wall spacing rule.",
     ),
     "basement_unfinished": CECRoomRequirement(
@@ -331,7 +324,7 @@ CEC_ROOM_REQUIREMENTS: dict[str, CECRoomRequirement] = {
         min_switches=1,
         needs_gfci=False,
         needs_afci=True,
-        cec_rules=["26-720 e)(iv)", "26-658 1)"],
+        cec_rules=("26-720 e)(iv)", "26-658 1)"),
         notes="At least 1 duplex receptacle. Luminaires <2m must be guarded.",
     ),
     "closet_walkin": CECRoomRequirement(
@@ -344,7 +337,7 @@ CEC_ROOM_REQUIREMENTS: dict[str, CECRoomRequirement] = {
         min_switches=1,
         needs_gfci=False,
         needs_afci=True,
-        cec_rules=["30-204"],
+        cec_rules=("30-204",),
         notes="Luminaire on ceiling or above door. No pendant or bare-lamp types.",
     ),
     "closet_standard": CECRoomRequirement(
@@ -357,7 +350,7 @@ CEC_ROOM_REQUIREMENTS: dict[str, CECRoomRequirement] = {
         min_switches=1,
         needs_gfci=False,
         needs_afci=True,
-        cec_rules=["30-204"],
+        cec_rules=("30-204",),
         notes="Luminaire on ceiling or above door. No pendant or bare-lamp types.",
     ),
     "entry_foyer": CECRoomRequirement(
@@ -370,7 +363,7 @@ CEC_ROOM_REQUIREMENTS: dict[str, CECRoomRequirement] = {
         min_switches=2,  # 3-way: inside and outside entry
         needs_gfci=False,
         needs_afci=True,
-        cec_rules=["26-722 a)", "26-722 b)", "26-658 1)"],
+        cec_rules=("26-722 a)", "26-722 b)", "26-658 1)"),
         notes="3-way switches at entry. 1.8m rule if finished room.",
     ),
     "utility_room": CECRoomRequirement(
@@ -383,7 +376,7 @@ CEC_ROOM_REQUIREMENTS: dict[str, CECRoomRequirement] = {
         min_switches=1,
         needs_gfci=True,  # likely has sink or water heater nearby
         needs_afci=True,
-        cec_rules=["26-720 e)(iii)", "26-704 1)"],
+        cec_rules=("26-720 e)(iii)", "26-704 1)"),
         notes="At least 1 duplex receptacle. GFCI if sink present.",
     ),
     "office_den": CECRoomRequirement(
@@ -396,7 +389,7 @@ CEC_ROOM_REQUIREMENTS: dict[str, CECRoomRequirement] = {
         min_switches=1,
         needs_gfci=False,
         needs_afci=True,
-        cec_rules=["26-722 a)", "26-658 1)"],
+        cec_rules=("26-722 a)", "26-658 1)"),
         notes="Standard room. 1.8m wall spacing rule.",
     ),
     "mudroom": CECRoomRequirement(
@@ -409,7 +402,7 @@ CEC_ROOM_REQUIREMENTS: dict[str, CECRoomRequirement] = {
         min_switches=1,
         needs_gfci=False,
         needs_afci=True,
-        cec_rules=["26-722 a)"],
+        cec_rules=("26-722 a)",),
         notes="Treated as entry/finished room.",
     ),
     "pantry": CECRoomRequirement(
@@ -422,7 +415,7 @@ CEC_ROOM_REQUIREMENTS: dict[str, CECRoomRequirement] = {
         min_switches=1,
         needs_gfci=False,
         needs_afci=True,
-        cec_rules=["30-204"],
+        cec_rules=("30-204",),
         notes="Treated like a closet — luminaire on ceiling or above door.",
     ),
     "stairway": CECRoomRequirement(
@@ -435,12 +428,27 @@ CEC_ROOM_REQUIREMENTS: dict[str, CECRoomRequirement] = {
         min_switches=2,  # 3-way switches top and bottom
         needs_gfci=False,
         needs_afci=True,
-        cec_rules=["30-200"],
+        cec_rules=("30-200",),
         notes="3-way switches at top and bottom of stairs.",
     ),
 }
 
 
+# Flat copy of CEC_ROOM_REQUIREMENTS for generate_devices_for_room:
+# (min_receptacles, receptacle_type, uses_wall_spacing_rule, wall_spacing_m,
+#  min_lighting_outlets, min_switches, needs_exhaust_fan, needs_smoke_detector,
+#  ((symbol, count), ...) of additional receptacles)
+_CEC_FAST: dict[str, tuple] = {
+    k: (
+        v.min_receptacles, v.receptacle_type, v.uses_wall_spacing_rule,
+        v.wall_spacing_m, v.min_lighting_outlets, v.min_switches,
+        v.needs_exhaust_fan, v.needs_smoke_detector,
+        tuple((extra["type"], extra["count"]) for extra in v.additional_receptacles),
+    )
+    for k, v in CEC_ROOM_REQUIREMENTS.items()
+}
+
+
 def calculate_receptacles_from_area(
     room: DetectedRoom, requirement: CECRoomRequirement
 ) -> int:
@@ -452,14 +460,20 @@ def calculate_receptacles_from_area(
     """
     if not requirement.uses_wall_spacing_rule:
         return requirement.min_receptacles
+    return _receptacles_for_spacing(
+        room.approx_area_sqft, requirement.wall_spacing_m, requirement.min_receptacles
+    )
 
+
+def _receptacles_for_spacing(area_sqft: float, wall_spacing_m: float, min_receptacles: int) -> int:
+    """Wall-spacing receptacle count (see calculate_receptacles_from_area)."""
     # Estimate perimeter from area (assume roughly rectangular)
-    sqft = max(room.approx_area_sqft, 50)
+    sqft = max(area_sqft, 50)
     side_ft = sqft ** 0.5
     perimeter_ft = side_ft * 4
 
     # Convert spacing rule to feet (1 m = 3.28 ft)
-    spacing_ft = requirement.wall_spacing_m * 3.28
+    spacing_ft = wall_spacing_m * 3.28
 
     # Each receptacle covers 2x the spacing distance (one on each side)
     coverage_ft = spacing_ft * 2
@@ -467,12 +481,22 @@ def calculate_receptacles_from_area(
     # Subtract ~30% for doorways, windows, closets, and corners
     usable_perimeter = perimeter_ft * 0.70
 
-    count = max(round(usable_perimeter / coverage_ft), requirement.min_receptacles)
+    count = max(round(usable_perimeter / coverage_ft), min_receptacles)
     # Cap: even a very large room rarely needs more than 8 duplex receptacles
     count = min(count, 8)
     return count
 
 
+# Room-type groups that share device rules in _devices_for
+_BATH_LIKE = frozenset({"bathroom", "powder_room"})
+_CLOSET_LIKE = frozenset({"closet_walkin", "closet_standard", "pantry"})
+_RECESSED_POT_ROOMS = frozenset({"living_room", "family_room", "primary_bedroom"})
+_CIRCULATION_ROOMS = frozenset({"hallway", "stairway"})
+_LARGE_3WAY_ROOMS = frozenset({
+    "primary_bedroom", "living_room", "family_room", "basement_finished",
+})
+
+
 def generate_devices_for_room(
     room: DetectedRoom,
 ) -> dict[str, int]:
@@ -480,75 +504,84 @@ def generate_devices_for_room(
 
     Returns a dict of symbol_type -> count, compatible with the estimator.
     """
-    req = CEC_ROOM_REQUIREMENTS.get(room.room_type)
-    if req is None:
+    return dict(_devices_for(room.room_type, room.approx_area_sqft))
+
+
+@lru_cache(maxsize=2048)
+def _devices_for(room_type: str, area_sqft: float) -> tuple[tuple[str, int], ...]:
+    """Device counts for a room type and area (memoized).
+
+    The counts depend on nothing else, and large developments repeat the
+    same room over and over.
+    """
+    fields = _CEC_FAST.get(room_type)
+    if fields is None:
         # Unknown room type — apply minimal defaults
-        return {"duplex_receptacle": 1, "surface_mount_light": 1, "single_pole_switch": 1}
+        return (("duplex_receptacle", 1), ("surface_mount_light", 1), ("single_pole_switch", 1))
+    (min_receptacles, receptacle_type, uses_spacing, spacing_m, min_lighting,
+     min_switches, needs_exhaust_fan, needs_smoke_detector, extras) = fields
 
-    devices: dict[str, int] = {}
+    devices: defaultdict[str, int] = defaultdict(int)
 
     # ── Receptacles ──
-    if room.room_type == "kitchen":
+    if room_type == "kitchen":
         # Counter receptacles (split or 20A GFCI)
-        devices["gfci_receptacle"] = max(req.min_receptacles, 3)
+        devices["gfci_receptacle"] = max(min_receptacles, 3)
         # Fridge dedicated
         devices["dedicated_receptacle"] = 1
-        # General wall receptacles
-        wall_recepts = calculate_receptacles_from_area(room, CECRoomRequirement(
-            room_type="kitchen_walls",
-            min_receptacles=2,
-            receptacle_type="duplex",
-            uses_wall_spacing_rule=True,
-            wall_spacing_m=1.8,
-        ))
-        devices["duplex_receptacle"] = wall_recepts
+        # General wall receptacles (1.8m rule, at least 2)
+        devices["duplex_receptacle"] = _receptacles_for_spacing(
+            area_sqft, 1.8, 2
+        )
         # Range hood
         devices["range_hood_fan"] = 1
-    elif room.room_type in ("bathroom", "powder_room"):
-        devices["gfci_receptacle"] = req.min_receptacles
-    elif room.room_type == "garage":
+    elif room_type in _BATH_LIKE:
+        devices["gfci_receptacle"] = min_receptacles
+    elif room_type == "garage":
         # 1 per car space — estimate from area
-        car_spaces = max(1, int(room.approx_area_sqft / 250))
+        car_spaces = max(1, int(area_sqft / 250))
         devices["duplex_receptacle"] = car_spaces + 1  # +1 for door opener
-    elif room.room_type == "laundry_room":
+    elif room_type == "laundry_room":
         devices["duplex_receptacle"] = 2  # washer + additional
         devices["dryer_outlet"] = 1
     else:
         # Standard rooms with wall spacing calculation
-        count = calculate_receptacles_from_area(room, req)
-        if req.receptacle_type == "gfci":
+        if uses_spacing:
+            count = _receptacles_for_spacing(area_sqft, spacing_m, min_receptacles)
+        else:
+            count = min_receptacles
+        if receptacle_type == "gfci":
             devices["gfci_receptacle"] = count
         else:
             devices["duplex_receptacle"] = count
 
     # Additional receptacles from requirement
-    for extra in req.additional_receptacles:
-        sym = extra["type"]
-        devices[sym] = devices.get(sym, 0) + extra["count"]
+    for sym, n in extras:
+        devices[sym] += n
 
     # ── Lighting ──
-    if req.min_lighting_outlets > 0:
-        if room.room_type in ("closet_walkin", "closet_standard", "pantry"):
+    if min_lighting > 0:
+        if room_type in _CLOSET_LIKE:
             devices["surface_mount_light"] = 1
-        elif room.room_type == "kitchen":
+        elif room_type == "kitchen":
             # Recessed lights proportional to area
-            pot_count = max(4, int(room.approx_area_sqft / 30))
+            pot_count = max(4, int(area_sqft / 30))
             devices["recessed_light"] = pot_count
-        elif room.room_type in ("bathroom", "powder_room"):
+        elif room_type in _BATH_LIKE:
             devices["surface_mount_light"] = 1
-        elif room.room_type in ("living_room", "family_room", "primary_bedroom"):
-            pot_count = max(4, int(room.approx_area_sqft / 40))
+        elif room_type in _RECESSED_POT_ROOMS:
+            pot_count = max(4, int(area_sqft / 40))
             devices["recessed_light"] = pot_count
-        elif room.room_type == "garage":
-            devices["fluorescent_light"] = max(1, int(room.approx_area_sqft / 200))
-        elif room.room_type == "basement_unfinished":
-            devices["fluorescent_light"] = max(1, int(room.approx_area_sqft / 200))
+        elif room_type == "garage":
+            devices["fluorescent_light"] = max(1, int(area_sqft / 200))
+        elif room_type == "basement_unfinished":
+            devices["fluorescent_light"] = max(1, int(area_sqft / 200))
         else:
-            devices["surface_mount_light"] = req.min_lighting_outlets
+            devices["surface_mount_light"] = min_lighting
 
     # ── Switches ──
-    if req.min_switches > 0:
-        if req.min_switches >= 2:
+    if min_switches > 0:
+        if min_switches >= 2:
             # 3-way switch pair (hallway, stairway, entry, garage)
             devices["three_way_switch"] = 2
         else:
@@ -559,21 +592,18 @@ def generate_devices_for_room(
             v for k, v in devices.items()
             if any(lw in k for lw in ("light", "pot_light", "fluorescent", "fan"))
         )
-        if total_lights > 4 and room.room_type not in ("hallway", "stairway"):
+        if total_lights > 4 and room_type not in _CIRCULATION_ROOMS:
             # Separate switch for each light group beyond the first
             # Kitchen: pot lights + range hood = 2 switches minimum
             # Living room with 6+ pots: consider dimmer
             extra_switches = max(0, (total_lights - 1) // 4)
-            if room.room_type == "kitchen":
+            if room_type == "kitchen":
                 extra_switches = max(extra_switches, 1)  # range hood switch
-            devices["single_pole_switch"] = devices.get("single_pole_switch", 0) + extra_switches
+            devices["single_pole_switch"] += extra_switches
 
         # Large rooms (>200 sqft) with single entrance still get single-pole,
         # but primary bedroom and living rooms > 250 sqft should get 3-way
-        if room.approx_area_sqft >= 250 and room.room_type in (
-            "primary_bedroom", "living_room", "family_room",
-            "basement_finished",
-        ):
+        if area_sqft >= 250 and room_type in _LARGE_3WAY_ROOMS:
             if "three_way_switch" not in devices:
                 devices["three_way_switch"] = 2
                 # Convert one single_pole to 3-way
@@ -581,14 +611,24 @@ def generate_devices_for_room(
                     devices["single_pole_switch"] -= 1
 
     # ── Exhaust Fan ──
-    if req.needs_exhaust_fan:
+    if needs_exhaust_fan:
         devices["exhaust_fan"] = 1
 
     # ── Smoke Detector ──
-    if req.needs_smoke_detector:
+    if needs_smoke_detector:
         devices["smoke_co_combo"] = 1
 
-    return devices
+    return tuple(devices.items())
+
+
+# Room types that get a data (Cat6) / TV (coax) outlet
+_DATA_ROOM_TYPES = frozenset({
+    "living_room", "family_room", "primary_bedroom", "bedroom",
+    "office_den", "basement_finished",
+})
+_TV_ROOM_TYPES = frozenset({
+    "living_room", "family_room", "primary_bedroom", "basement_finished",
+})
 
 
 def generate_whole_house_devices(
@@ -598,26 +638,26 @@ def generate_whole_house_devices(
 
     Returns aggregated symbol_type -> count dict for the estimator.
     """
-    totals: dict[str, int] = {}
+    type_hist = Counter(r.room_type for r in all_rooms)
+    totals: defaultdict[str, int] = defaultdict(int)
 
     for room in all_rooms:
-        room_devices = generate_devices_for_room(room)
-        for sym, count in room_devices.items():
-            totals[sym] = totals.get(sym, 0) + count
+        for sym, count in generate_devices_for_room(room).items():
+            totals[sym] += count
 
     # ── Whole-house requirements ──
 
     # Exterior receptacle (Rule 26-724 a) — at least 1 outdoor GFCI
-    totals["outdoor_receptacle"] = totals.get("outdoor_receptacle", 0) + 1
+    totals["outdoor_receptacle"] += 1
 
     # Exterior lighting — front and rear entry lights
-    totals["exterior_light"] = totals.get("exterior_light", 0) + 2
+    totals["exterior_light"] += 2
 
     # Doorbell
-    totals["doorbell"] = totals.get("doorbell", 0) + 1
+    totals["doorbell"] += 1
 
     # Thermostat
-    totals["thermostat"] = totals.get("thermostat", 0) + 1
+    totals["thermostat"] += 1
 
     # Panel board (every house needs one)
     if totals.get("panel_board", 0) == 0:
@@ -625,29 +665,15 @@ def generate_whole_house_devices(
 
     # ── Low-voltage: Data (Cat6) and TV (Coax) outlets ──
     # Standard practice: data + TV in living areas and bedrooms
-    data_rooms = sum(
-        1 for r in all_rooms
-        if r.room_type in (
-            "living_room", "family_room", "primary_bedroom", "bedroom",
-            "office_den", "basement_finished",
-        )
-    )
-    totals["data_outlet"] = totals.get("data_outlet", 0) + max(data_rooms, 1)
+    data_rooms = sum(type_hist[t] for t in _DATA_ROOM_TYPES)
+    totals["data_outlet"] += max(data_rooms, 1)
 
-    tv_rooms = sum(
-        1 for r in all_rooms
-        if r.room_type in (
-            "living_room", "family_room", "primary_bedroom",
-            "basement_finished",
-        )
-    )
-    totals["tv_outlet"] = totals.get("tv_outlet", 0) + max(tv_rooms, 1)
+    tv_rooms = sum(type_hist[t] for t in _TV_ROOM_TYPES)
+    totals["tv_outlet"] += max(tv_rooms, 1)
 
     # Ensure smoke/CO in hallways near bedrooms if not already covered
-    bedroom_count = sum(
-        1 for r in all_rooms if r.room_type in ("bedroom", "primary_bedroom")
-    )
-    hallway_count = sum(1 for r in all_rooms if r.room_type == "hallway")
+    bedroom_count = type_hist["bedroom"] + type_hist["primary_bedroom"]
+    hallway_count = type_hist["hallway"]
     smoke_count = totals.get("smoke_co_combo", 0)
 
     # CEC/NBC requires smoke alarms in each sleeping room + outside sleeping areas
@@ -656,13 +682,11 @@ def generate_whole_house_devices(
         totals["smoke_co_combo"] = bedroom_count + max(hallway_count, 1)
 
     # Basement stair smoke detector
-    has_basement = any(
-        r.room_type in ("basement_finished", "basement_unfinished") for r in all_rooms
-    )
+    has_basement = bool(type_hist["basement_finished"] or type_hist["basement_unfinished"])
     if has_basement:
-        totals["smoke_co_combo"] = totals.get("smoke_co_combo", 0) + 1
+        totals["smoke_co_combo"] += 1
 
-    return totals
+    return dict(totals)
 
 
 def rooms_from_table_data(
@@ -702,14 +726,25 @@ def rooms_from_table_data(
             has_bathtub_shower=has_bathtub,
             wall_count=4,
             confidence=1.0,  # table data is high confidence
-            location=[],
         ))
 
     return rooms
 
 
+@lru_cache(maxsize=1)
+def _room_type_keys() -> tuple[tuple[str, str], ...]:
+    """(name, room_type) pairs of _ROOM_TYPE_MAP, longest name first."""
+    from sparkestimate.core.pdf_processor import _ROOM_TYPE_MAP
+
+    return tuple(sorted(_ROOM_TYPE_MAP.items(), key=lambda kv: len(kv[0]), reverse=True))
+
+
+@lru_cache(maxsize=4096)
 def _classify_room_type(name: str) -> str:
-    """Map a room name from a PDF table to a standardized room type."""
+    """Map a room name from a PDF table to a standardized room type.
+
+    Memoized: schedules repeat names like "Bedroom 2" across units.
+    """
     from sparkestimate.core.pdf_processor import _ROOM_TYPE_MAP
 
     name_lower = name.lower().strip()
@@ -719,10 +754,9 @@ def _classify_room_type(name: str) -> str:
         return _ROOM_TYPE_MAP[name_lower]
 
     # Try partial match (longest match first to prefer "primary bedroom" over "bedroom")
-    sorted_keys = sorted(_ROOM_TYPE_MAP.keys(), key=len, reverse=True)
-    for key in sorted_keys:
+    for key, room_type in _room_type_keys():
         if key in name_lower:
-            return _ROOM_TYPE_MAP[key]
+            return room_type
 
     # Default: treat as bedroom if "bedroom" variants, otherwise generic room
     if any(kw in name_lower for kw in ("bed", "bdrm", "br ")):
@@ -731,62 +765,214 @@ def _classify_room_type(name: str) -> str:
     return "office_den"  # safe default for unlabelled rooms
 
 
+def _encode_page(img: Image.Image, image_format: str) -> tuple[bytes, str]:
+    """Encode a page image for upload; returns (data, mime_type).
+
+    PNG is written at zlib level 1: Gemini decodes it once, so a slightly
+    larger upload beats the CPU of the default level 6. "auto" sends
+    large RGB renders (over 4 MP) as JPEG q92 without chroma subsampling,
+    and everything else as PNG.
+    """
+    buf = io.BytesIO()
+    if image_format == "jpeg" or (
+        image_format == "auto" and img.mode == "RGB"
+        and img.width * img.height > _JPEG_MIN_PIXELS
+    ):
+        if img.mode not in ("RGB", "L"):
+            img = img.convert("RGB")
+        img.save(buf, format="JPEG", quality=92, subsampling=0)
+        return buf.getvalue(), "image/jpeg"
+    img.save(buf, format="PNG", compress_level=1, optimize=False)
+    return buf.getvalue(), "image/png"
+
+
+# Upload encodings accepted by RoomDetector(image_format=...)
+IMAGE_FORMATS = ("png", "jpeg", "auto")
+
+# "auto" switches RGB pages above this many pixels to JPEG
+_JPEG_MIN_PIXELS = 4_000_000
+
+
+def _store_response(path: Path, raw_text: str) -> None:
+    """Write a Gemini response to the disk cache atomically (best effort)."""
+    try:
+        fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(raw_text)
+            os.replace(tmp, path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+    except OSError:
+        pass  # a full or read-only cache dir just means no caching
+
+
 class RoomDetector:
     """Detects rooms from architectural floor plans using Gemini Vision."""
 
-    def __init__(self, api_key: str, model: str = "gemini-2.0-flash"):
+    def __init__(
+        self,
+        api_key: str,
+        model: str = "gemini-2.0-flash",
+        concurrency: int = 8,
+        image_format: str = "png",
+        cache_dir: str | Path | None = None,
+    ):
+        if image_format not in IMAGE_FORMATS:
+            raise ValueError(
+                f"image_format must be one of {IMAGE_FORMATS}, got {image_format!r}"
+            )
         self.api_key = api_key
+        self.image_format = image_format
         self.model = model
+        self.concurrency = max(1, concurrency)
         self._client = None
+        # Responses keyed by image bytes, prompt and model; reused across runs
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None
+        if self.cache_dir is not None:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
 
     def _get_client(self):
         if self._client is None:
-            from google import genai
-            self._client = genai.Client(api_key=self.api_key)
+            # Same process-wide client (and keep-alive pool) per API key as
+            # the drawing analyzer
+            from sparkestimate.core.gemini_client import shared_client
+
+            self._client = shared_client(self.api_key, self.concurrency)
         return self._client
 
     def detect_rooms(
         self, img: Image.Image, page_number: int = 0
     ) -> FloorPlanAnalysis:
         """Analyze a single floor plan page for rooms."""
-        client = self._get_client()
-
-        buf = io.BytesIO()
-        img.save(buf, format="PNG")
-        image_bytes = buf.getvalue()
+        image_bytes, mime_type = _encode_page(img, self.image_format)
+        return self.detect_rooms_bytes(image_bytes, mime_type, page_number)
 
-        from google.genai import types
+    def detect_rooms_bytes(
+        self, image_bytes: bytes, mime_type: str, page_number: int = 0
+    ) -> FloorPlanAnalysis:
+        """Analyze an already-encoded floor plan image (PNG, JPEG, WebP...).
+
+        Callers holding encoded page bytes (e.g. from PyMuPDF's
+        ``pixmap.tobytes("png")``) skip the PIL decode/re-encode.
+        With a cache_dir, a page already analyzed with the same prompt and
+        model is answered from disk without calling Gemini.
+        """
+        cache_path = None
+        if self.cache_dir is not None:
+            key = hashlib.sha256(image_bytes)
+            key.update(f":{PROMPT_HASH}:{self.model}".encode())
+            cache_path = self.cache_dir / f"{key.hexdigest()}.json"
+            try:
+                cached = cache_path.read_text(encoding="utf-8")
+            except OSError:
+                cached = None
+            if cached is not None:
+                return self._parse_response(cached, page_number)
 
+        client = self._get_client()
         response = client.models.generate_content(
             model=self.model,
             contents=[
-                types.Content(
+                genai_types.Content(
                     parts=[
-                        types.Part.from_bytes(data=image_bytes, mime_type="image/png"),
-                        types.Part.from_text(text=ROOM_DETECTION_PROMPT),
+                        genai_types.Part.from_bytes(data=image_bytes, mime_type=mime_type),
+                        genai_types.Part.from_text(text=ROOM_DETECTION_PROMPT),
                     ]
                 )
             ],
-            config=types.GenerateContentConfig(
+            config=genai_types.GenerateContentConfig(
                 temperature=0.1,
                 max_output_tokens=4096,
+                response_mime_type="application/json",
+                response_schema=ROOM_DETECTION_SCHEMA,
             ),
         )
 
-        raw_text = response.text.strip()
-        if raw_text.startswith("```"):
-            raw_text = raw_text.split("\n", 1)[1]
-            if raw_text.endswith("```"):
-                raw_text = raw_text[:-3].strip()
+        raw_text = response.text
+        analysis = self._parse_response(raw_text, page_number)
+        if cache_path is not None and analysis.rooms:  # don't pin unparseable replies
+            _store_response(cache_path, raw_text)
+        return analysis
 
-        return self._parse_response(raw_text, page_number)
+    def submit_batch(self, images: dict[int, Image.Image]) -> str:
+        """Submit floor plan pages to the Gemini Batch API; returns the job name.
+
+        Batch jobs bill at half the interactive rate but complete
+        asynchronously (target turnaround 24 hours), so this suits
+        whole-building runs where nothing waits on the answer. Poll with
+        collect_batch().
+        """
+        client = self._get_client()
+        lines = []
+        for page_num, img in sorted(images.items()):
+            data, mime_type = _encode_page(img, self.image_format)
+            request = {
+                "contents": [{
+                    "parts": [
+                        {"inline_data": {
+                            "mime_type": mime_type,
+                            "data": base64.b64encode(data).decode("ascii"),
+                        }},
+                        {"text": ROOM_DETECTION_PROMPT},
+                    ],
+                }],
+                "generation_config": {
+                    "temperature": 0.1,
+                    "max_output_tokens": 4096,
+                    "response_mime_type": "application/json",
+                    "response_schema": ROOM_DETECTION_SCHEMA,
+                },
+            }
+            lines.append(json.dumps({"key": f"page_{page_num}", "request": request}))
+
+        src = client.files.upload(
+            file=io.BytesIO("\n".join(lines).encode("utf-8")),
+            config=genai_types.UploadFileConfig(mime_type="jsonl"),
+        )
+        job = client.batches.create(model=self.model, src=src.name)
+        return job.name
+
+    def collect_batch(self, job_name: str) -> Optional[list[FloorPlanAnalysis]]:
+        """Results of a submit_batch() job in page order, or None while it runs.
+
+        Raises RuntimeError if the job failed, was cancelled or expired.
+        """
+        client = self._get_client()
+        job = client.batches.get(name=job_name)
+        state = job.state.name
+        if state in ("JOB_STATE_FAILED", "JOB_STATE_CANCELLED", "JOB_STATE_EXPIRED"):
+            raise RuntimeError(f"Batch job {job_name} ended in {state}")
+        if state not in ("JOB_STATE_SUCCEEDED", "JOB_STATE_PARTIALLY_SUCCEEDED"):
+            return None
+
+        content = client.files.download(file=job.dest.file_name)
+        results = []
+        for line in content.decode("utf-8").splitlines():
+            if not line.strip():
+                continue
+            record = _json_loads(line)
+            page_number = int(record["key"].removeprefix("page_"))
+            try:
+                parts = record["response"]["candidates"][0]["content"]["parts"]
+                raw_text = "".join(part.get("text", "") for part in parts)
+            except (KeyError, IndexError, TypeError):
+                # Per-request error: keep the page with no rooms
+                results.append(FloorPlanAnalysis(
+                    page_number=page_number, rooms=[], raw_response=line,
+                ))
+                continue
+            results.append(self._parse_response(raw_text, page_number))
+        results.sort(key=lambda a: a.page_number)
+        return results
 
     def _parse_response(
         self, raw_text: str, page_number: int
     ) -> FloorPlanAnalysis:
         """Parse the JSON response into structured room data."""
         try:
-            data = json.loads(raw_text)
+            data = _json_loads(raw_text)
         except json.JSONDecodeError:
             return FloorPlanAnalysis(
                 page_number=page_number,
@@ -806,7 +992,7 @@ class RoomDetector:
                     has_bathtub_shower=rm.get("has_bathtub_shower", False),
                     wall_count=rm.get("wall_count", 4),
                     confidence=rm.get("confidence", 0.0),
-                    location=rm.get("location", []),
+                    location=tuple(rm.get("location") or ()),
                 )
             )
 
@@ -821,9 +1007,65 @@ class RoomDetector:
     def analyze_floor_plans(
         self, images: dict[int, Image.Image]
     ) -> list[FloorPlanAnalysis]:
-        """Analyze multiple floor plan pages."""
+        """Analyze multiple floor plan pages.
+
+        Pages are sent to Gemini concurrently (up to ``self.concurrency``
+        requests in flight); results are returned in page order. A page
+        whose request fails yields an empty analysis, with the exception's
+        repr as its raw_response, instead of aborting the rest.
+        Pixel-identical pages (repeated unit plans) are analyzed once and
+        the result copied to each of them.
+        """
+        pages = sorted(images.items())
+        # Pixel digest -> first page with that image
+        first_page: dict[bytes, int] = {}
+        same_as: dict[int, int] = {}
+        unique = []
+        for page_num, img in pages:
+            digest = hashlib.sha256(img.tobytes())
+            digest.update(f"{img.mode}:{img.size}".encode())
+            key = digest.digest()
+            if key in first_page:
+                same_as[page_num] = first_page[key]
+            else:
+                first_page[key] = page_num
+                unique.append((page_num, img))
+
+        analyzed = {a.page_number: a for a in self._analyze_pages(unique)}
         results = []
-        for page_num, img in sorted(images.items()):
-            analysis = self.detect_rooms(img, page_num)
-            results.append(analysis)
+        for page_num, _ in pages:
+            if page_num in analyzed:
+                results.append(analyzed[page_num])
+            else:
+                src = analyzed[same_as[page_num]]
+                results.append(replace(
+                    src, page_number=page_num, rooms=[replace(r) for r in src.rooms],
+                ))
         return results
+
+    def _analyze_pages(
+        self, pages: list[tuple[int, Image.Image]]
+    ) -> list[FloorPlanAnalysis]:
+        """detect_rooms over (page_number, image) pairs, on the thread pool."""
+        if len(pages) <= 1 or self.concurrency == 1:
+            return [self._detect_page(img, page_num) for page_num, img in pages]
+
+        self._get_client()  # build once before fanning out
+        with ThreadPoolExecutor(max_workers=min(self.concurrency, len(pages))) as pool:
+            return list(pool.map(
+                self._detect_page,
+                [img for _, img in pages], [page_num for page_num, _ in pages],
+            ))
+
+    def _detect_page(self, img: Image.Image, page_number: int) -> FloorPlanAnalysis:
+        """detect_rooms, turning a failure into an empty analysis.
+
+        The exception's repr goes in raw_response so a systemic failure
+        (bad API key, quota) stays visible to the caller.
+        """
+        try:
+            return self.detect_rooms(img, page_number)
+        except Exception as exc:
+            return FloorPlanAnalysis(
+                page_number=page_number, rooms=[], raw_response=repr(exc),
+            )
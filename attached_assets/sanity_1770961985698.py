@@ -7,7 +7,7 @@ They don't replace human review but catch the worst AI mistakes.
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True)
 class SanityWarning:
     rule: str
     message: str
@@ -15,6 +15,29 @@ class SanityWarning:
     symbol_type: str = ""
 
 
+# (symbol, absolute maximum per floor, message) — residential
+_MAX_RULES = (
+    ("duplex_receptacle", 80, "More than 80 outlets seems excessive for residential"),
+    ("gfci_receptacle", 20, "More than 20 GFCI outlets is unusual"),
+    ("single_pole_switch", 50, "More than 50 switches seems high for residential"),
+    ("recessed_light", 100, "More than 100 pot lights is very high"),
+    ("pot_light", 100, "More than 100 pot lights is very high"),
+    ("smoke_detector", 20, "More than 20 smoke detectors is unusual for residential"),
+    ("panel_board", 3, "More than 3 panels is unusual for residential"),
+    ("exhaust_fan", 10, "More than 10 exhaust fans is unusual"),
+)
+
+_SWITCH_SYMS = ("single_pole_switch", "three_way_switch", "four_way_switch", "dimmer_switch")
+_LIGHT_SYMS = (
+    "recessed_light", "pot_light", "surface_mount_light",
+    "pendant_light", "wall_sconce", "exterior_light",
+    "track_light", "fluorescent_light", "led_panel_light",
+)
+# Defaults for map(symbol_counts.get, syms, zeros)
+_SWITCH_ZEROS = (0,) * len(_SWITCH_SYMS)
+_LIGHT_ZEROS = (0,) * len(_LIGHT_SYMS)
+
+
 def check_counts(
     symbol_counts: dict[str, int], house_sqft: float = 0
 ) -> list[SanityWarning]:
@@ -23,18 +46,7 @@ def check_counts(
     total_devices = sum(symbol_counts.values())
 
     # --- Absolute maximums (per floor, residential) ---
-    max_rules = {
-        "duplex_receptacle": (80, "More than 80 outlets seems excessive for residential"),
-        "gfci_receptacle": (20, "More than 20 GFCI outlets is unusual"),
-        "single_pole_switch": (50, "More than 50 switches seems high for residential"),
-        "recessed_light": (100, "More than 100 pot lights is very high"),
-        "pot_light": (100, "More than 100 pot lights is very high"),
-        "smoke_detector": (20, "More than 20 smoke detectors is unusual for residential"),
-        "panel_board": (3, "More than 3 panels is unusual for residential"),
-        "exhaust_fan": (10, "More than 10 exhaust fans is unusual"),
-    }
-
-    for sym, (max_count, msg) in max_rules.items():
+    for sym, max_count, msg in _MAX_RULES:
         count = symbol_counts.get(sym, 0)
         if count > max_count:
             warnings.append(SanityWarning(
@@ -85,18 +97,8 @@ def check_counts(
 
     # --- Ratio checks ---
     # Switches should roughly correlate with light fixtures
-    total_switches = sum(
-        symbol_counts.get(s, 0)
-        for s in ["single_pole_switch", "three_way_switch", "four_way_switch", "dimmer_switch"]
-    )
-    total_lights = sum(
-        symbol_counts.get(s, 0)
-        for s in [
-            "recessed_light", "pot_light", "surface_mount_light",
-            "pendant_light", "wall_sconce", "exterior_light",
-            "track_light", "fluorescent_light", "led_panel_light",
-        ]
-    )
+    total_switches = sum(map(symbol_counts.get, _SWITCH_SYMS, _SWITCH_ZEROS))
+    total_lights = sum(map(symbol_counts.get, _LIGHT_SYMS, _LIGHT_ZEROS))
     if total_lights > 5 and total_switches == 0:
         warnings.append(SanityWarning(
             rule="ratio_check",
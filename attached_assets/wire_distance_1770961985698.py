@@ -12,6 +12,7 @@ paths along joists, studs, and through walls.
 
 from __future__ import annotations
 from dataclasses import dataclass
+from math import hypot
 
 # Routing factor: cables don't run straight; they follow studs/joists
 # Industry practice: multiply straight-line by 1.4-1.6 for residential
@@ -35,7 +36,11 @@ FLOOR_ORDER = {
 }
 
 
-@dataclass
+# Floor levels that put an auto-detected panel in the basement
+_PANEL_BASEMENT_FLOORS = frozenset({"basement", "basement_unfinished"})
+
+
+@dataclass(slots=True)
 class WireDistanceResult:
     """Wire distance calculation result for one room."""
     room_name: str
@@ -58,6 +63,8 @@ def calculate_wire_distances(
     house_perimeter_ft: float = 80.0,
     panel_floor: str = "",
     meter_floor: str = "",
+    overrides: dict[str, float] | None = None,
+    skip_empty_rooms: bool = False,
 ) -> list[WireDistanceResult]:
     """Calculate wire distances from panel to each room.
 
@@ -73,6 +80,11 @@ def calculate_wire_distances(
             If empty, auto-detected from rooms.
         meter_floor: user-selected floor for meter. Stored for reference
             but wire runs are calculated from panel, not meter.
+        overrides: if given, filled in the same pass with the per-type
+            averages override_wire_allowances() would return.
+        skip_empty_rooms: if True, rooms with no devices get a zero-filled
+            result instead of a distance calculation. Results stay one per
+            room, so indices still line up with room_device_counts.
 
     Returns:
         list of WireDistanceResult for each room
@@ -91,9 +103,26 @@ def calculate_wire_distances(
     # Use user-selected panel floor, or auto-detect
     if not panel_floor:
         panel_floor = _guess_panel_floor(rooms)
+    panel_floor_num = FLOOR_ORDER.get(panel_floor, 1)
+
+    type_sum: dict[str, float] = {}
+    type_n: dict[str, int] = {}
+    # Vertical run per floor level; drawings have only a handful of levels
+    vertical_by_level: dict[str, float] = {}
 
     results = []
     for i, room in enumerate(rooms):
+        # Count devices in this room
+        counts = room_device_counts.get(i) if room_device_counts else None
+        device_count = sum(counts.values()) if counts is not None else 0
+
+        if skip_empty_rooms and device_count == 0:
+            results.append(WireDistanceResult(
+                room.room_name, room.room_type, room.floor_level or "main",
+                0.0, 0.0, 0.0, 0.0, 0.0, 0, 0,
+            ))
+            continue
+
         # Get room centroid
         if room.location and len(room.location) >= 2:
             rx, ry = room.location[0], room.location[1]
@@ -101,64 +130,81 @@ def calculate_wire_distances(
             # No location — fall back to grid estimate
             rx, ry = 50.0, 50.0  # center of drawing
 
-        # Pixel distance (in percent units)
-        dx_pct = abs(px - rx)
-        dy_pct = abs(py - ry)
+        # Offsets in percent units, converted to feet
+        dx_ft = abs(px - rx) * drawing_scale_ft
+        dy_ft = abs(py - ry) * drawing_scale_ft
 
-        # Convert to feet
-        dx_ft = dx_pct * drawing_scale_ft
-        dy_ft = dy_pct * drawing_scale_ft
-
-        straight_ft = (dx_ft**2 + dy_ft**2) ** 0.5
+        straight_ft = hypot(dx_ft, dy_ft)
         manhattan_ft = dx_ft + dy_ft
 
         # Apply routing factor
         routed_ft = manhattan_ft * ROUTING_FACTOR
 
         # Vertical run for floor differences
-        room_floor_num = FLOOR_ORDER.get(room.floor_level, 1)
-        panel_floor_num = FLOOR_ORDER.get(panel_floor, 1)
-        floor_diff = abs(room_floor_num - panel_floor_num)
-        vertical_ft = floor_diff * VERTICAL_PER_FLOOR_FT
+        level = room.floor_level
+        vertical_ft = vertical_by_level.get(level)
+        if vertical_ft is None:
+            floor_diff = abs(FLOOR_ORDER.get(level, 1) - panel_floor_num)
+            vertical_ft = vertical_by_level[level] = floor_diff * VERTICAL_PER_FLOOR_FT
 
         # Per-device wire allowance
         per_device_ft = routed_ft + vertical_ft + DEVICE_MAKEUP_FT
 
         # Minimum realistic wire run (even adjacent rooms need some wire)
         per_device_ft = max(per_device_ft, 10.0)
+        per_device_rounded = round(per_device_ft, 1)
 
-        # Count devices in this room
-        if room_device_counts and i in room_device_counts:
-            device_count = sum(room_device_counts[i].values())
-        else:
-            device_count = 0
+        if counts is not None and overrides is not None:
+            _accumulate(type_sum, type_n, per_device_rounded, counts)
 
         total_wire = per_device_ft * device_count if device_count > 0 else 0
 
+        # Positional: keyword calls cost ~2.5x as much on this hot path
         results.append(WireDistanceResult(
-            room_name=room.room_name,
-            room_type=room.room_type,
-            floor_level=room.floor_level or "main",
-            straight_line_ft=round(straight_ft, 1),
-            manhattan_ft=round(manhattan_ft, 1),
-            routed_ft=round(routed_ft, 1),
-            vertical_ft=round(vertical_ft, 1),
-            total_per_device_ft=round(per_device_ft, 1),
-            devices_in_room=device_count,
-            total_room_wire_ft=round(total_wire, 0),
+            room.room_name,
+            room.room_type,
+            level or "main",
+            round(straight_ft, 1),    # straight_line_ft
+            round(manhattan_ft, 1),   # manhattan_ft
+            round(routed_ft, 1),      # routed_ft
+            round(vertical_ft, 1),    # vertical_ft
+            per_device_rounded,       # total_per_device_ft
+            device_count,             # devices_in_room
+            round(total_wire, 0),     # total_room_wire_ft
         ))
 
+    if overrides is not None:
+        overrides.update(_averages(type_sum, type_n))
     return results
 
 
+def _accumulate(
+    type_sum: dict[str, float], type_n: dict[str, int],
+    per_device: float, counts: dict[str, int],
+) -> None:
+    """Add one room's devices at per_device feet each to the per-type totals."""
+    for sym_type, count in counts.items():
+        type_sum[sym_type] = type_sum.get(sym_type, 0.0) + per_device * count
+        type_n[sym_type] = type_n.get(sym_type, 0) + count
+
+
+def _averages(type_sum: dict[str, float], type_n: dict[str, int]) -> dict[str, float]:
+    """Weighted average wire per device for each type with any devices."""
+    return {
+        sym_type: round(total / type_n[sym_type], 1)
+        for sym_type, total in type_sum.items()
+        if type_n[sym_type]
+    }
+
+
 def _guess_panel_floor(rooms: list) -> str:
     """Guess which floor the panel is on based on room data.
 
     Panels are typically in the basement (if exists) or main floor.
     """
-    floor_types = {r.floor_level for r in rooms if r.floor_level}
-    if "basement" in floor_types or "basement_unfinished" in floor_types:
-        return "basement"
+    for r in rooms:
+        if r.floor_level in _PANEL_BASEMENT_FLOORS:
+            return "basement"
     return "main"
 
 
@@ -174,24 +220,12 @@ def override_wire_allowances(
     Returns a dict of symbol_type -> average_wire_ft_per_device
     computed from the distance results.
     """
-    # Accumulate total wire and count per symbol type across all rooms
-    type_totals: dict[str, list[float]] = {}
+    # Accumulate total wire and device count per symbol type across all rooms
+    type_sum: dict[str, float] = {}
+    type_n: dict[str, int] = {}
 
     for i, result in enumerate(wire_results):
-        if i not in room_device_counts:
-            continue
-        per_device = result.total_per_device_ft
-        for sym_type, count in room_device_counts[i].items():
-            if sym_type not in type_totals:
-                type_totals[sym_type] = []
-            for _ in range(count):
-                type_totals[sym_type].append(per_device)
-
-    # Calculate weighted average per type
-    overrides = {}
-    for sym_type, distances in type_totals.items():
-        if distances:
-            avg = sum(distances) / len(distances)
-            overrides[sym_type] = round(avg, 1)
-
-    return overrides
+        if i in room_device_counts:
+            _accumulate(type_sum, type_n, result.total_per_device_ft, room_device_counts[i])
+
+    return _averages(type_sum, type_n)